@@ -1,5 +1,9 @@
 # app.py
 import streamlit as st
 
+from utils.prewarm import start_prewarm
+
+start_prewarm()
+
 st.title("Welcome to Football Dashboard")
 st.write("Select a page from the sidebar.")
\ No newline at end of file
@@ -0,0 +1,118 @@
+"""Generate the synthetic sheet CSVs the benchmarks serve instead of Google Sheets.
+
+Usage: python -m benchmarks.make_fixtures
+
+Writes ``benchmarks/fixtures/<family>_<season>.csv`` for every entry in
+``utils.sources.CSV_URLS``.  The columns and value formats (``"41.2%"``
+percentages, padded receiving headers) mirror the published sheets; the
+numbers are random but seeded, so the files are reproducible.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from utils.sources import CSV_URLS, team_conference
+
+FIXTURE_DIR = Path(__file__).resolve().parent / "fixtures"
+
+TEAMS = list(team_conference)
+ABBRS = [team.split()[-1][:3].upper() for team in TEAMS]
+PLAYERS = [f"Player {i:03d}" for i in range(300)]
+
+
+def _pct(values):
+    return [f"{v:.1f}%" for v in values]
+
+
+def _passing(rng):
+    n = 45
+    att = rng.integers(40, 650, n)
+    cmp_ = (att * rng.uniform(0.55, 0.72, n)).astype(int)
+    first_downs = (cmp_ * rng.uniform(0.45, 0.6, n)).astype(int)
+    games = rng.integers(2, 18, n)
+    yds = (att * rng.uniform(5.5, 8.5, n)).astype(int)
+    df = pd.DataFrame({
+        'Player': rng.choice(PLAYERS, n, replace=False),
+        'Team': rng.choice(ABBRS, n),
+        'Age': rng.integers(22, 41, n),
+        'G': games,
+        'Cmp': cmp_,
+        'Att': att,
+        'Yds': yds,
+        'TD': rng.integers(0, 45, n),
+        'Int': rng.integers(0, 20, n),
+        '1D': first_downs,
+        'First Down Rate': _pct(first_downs / att * 100),
+        'Yards per First Down': np.round(yds / np.maximum(first_downs, 1), 1),
+        'First Down Rate per Game': np.round(first_downs / games, 1),
+        'Succ%': _pct(rng.uniform(30, 55, n)),
+        'Rate': np.round(rng.uniform(60, 120, n), 1),
+        'QBR': np.round(rng.uniform(20, 80, n), 1),
+    })
+    df.loc[rng.integers(0, n, 3), 'QBR'] = np.nan
+    return df
+
+
+def _rushing(rng):
+    n = 140
+    att = rng.integers(5, 350, n)
+    first_downs = (att * rng.uniform(0.15, 0.35, n)).astype(int)
+    return pd.DataFrame({
+        'Player': rng.choice(PLAYERS, n, replace=False),
+        'Team': rng.choice(ABBRS, n),
+        'Att': att,
+        'Yds': (att * rng.uniform(3.0, 5.5, n)).astype(int),
+        'TD': rng.integers(0, 18, n),
+        '1D': first_downs,
+        'Rushing First Down Rate': _pct(first_downs / att * 100),
+        'Explosiveness': np.round(rng.uniform(0, 3, n), 2),
+    })
+
+
+def _receiving(rng):
+    n = 160
+    first_downs = rng.integers(0, 95, n)
+    return pd.DataFrame({
+        ' Player': rng.choice(PLAYERS, n, replace=False),
+        'Team ': rng.choice(ABBRS, n),
+        'Rec': first_downs + rng.integers(0, 40, n),
+        'Yds': first_downs * rng.integers(9, 16, n),
+        'TD': rng.integers(0, 15, n),
+        '1D': first_downs,
+    })
+
+
+def _teams(rng):
+    pass_ = rng.integers(150, 250, len(TEAMS))
+    rush = rng.integers(80, 140, len(TEAMS))
+    pen = rng.integers(10, 40, len(TEAMS))
+    df = pd.DataFrame({'TEAM': TEAMS, 'TOTAL': pass_ + rush + pen, 'RUSH': rush, 'PASS': pass_, 'PEN': pen})
+    # The published team sheets are sorted by TOTAL.
+    return df.sort_values('TOTAL', ascending=False)
+
+
+BUILDERS = {
+    'passing': _passing,
+    'rushing': _rushing,
+    'receiving': _receiving,
+    'teams': _teams,
+}
+
+
+def fixture_path(family, season):
+    return FIXTURE_DIR / f"{family}_{season}.csv"
+
+
+def main():
+    FIXTURE_DIR.mkdir(exist_ok=True)
+    rng = np.random.default_rng(2024)
+    for family, urls in CSV_URLS.items():
+        for season in sorted(urls):
+            BUILDERS[family](rng).to_csv(fixture_path(family, season), index=False)
+    print(f"Wrote fixtures to {FIXTURE_DIR}")
+
+
+if __name__ == "__main__":
+    main()
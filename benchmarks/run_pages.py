@@ -0,0 +1,255 @@
+"""Headless benchmark of every page in ``pages/``.
+
+Usage:
+    python -m benchmarks.run_pages                    # run and compare to baseline
+    python -m benchmarks.run_pages --save-baseline    # record a new baseline
+    python -m benchmarks.run_pages --latency 0.3      # simulate Sheets latency
+    python -m benchmarks.run_pages --prewarm          # first visit after startup prewarm
+
+Each page is driven with Streamlit's ``AppTest``.  Sheet downloads are
+answered from ``benchmarks/fixtures`` (see ``make_fixtures.py``) into a
+throwaway disk cache, optionally after ``--latency`` seconds to mimic the
+Google Sheets round trip.  For every page we record the cold run (empty
+memory and disk caches), a warm rerun, and one rerun per widget
+interaction, with wall time and tracemalloc peak memory.
+
+Timings include tracemalloc overhead unless ``--no-memory`` is given, so
+only compare runs made with the same flags on the same machine.  The
+baseline lives in ``benchmarks/baseline.json`` and is not committed.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from email.message import Message
+from pathlib import Path
+
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+# Keep the per-rerun timing log and the store refresh log lines out of the
+# benchmark report, and the background prewarm and refresher from running
+# alongside the measured steps.
+os.environ.setdefault("FIRSTDOWN_TIMING_LOG", "off")
+os.environ.setdefault("FIRSTDOWN_LOG_LEVEL", "WARNING")
+os.environ.setdefault("FIRSTDOWN_PREWARM", "off")
+os.environ.setdefault("FIRSTDOWN_REFRESH_INTERVAL", "0")
+
+import utils.disk_cache as disk_cache
+import utils.memcache as memcache
+import utils.prewarm as prewarm
+from benchmarks.make_fixtures import fixture_path
+from utils.sources import CSV_URLS
+
+ROOT = Path(__file__).resolve().parent.parent
+PAGES_DIR = ROOT / "pages"
+BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+
+# --------------------------
+# Fixture-backed downloads
+# --------------------------
+FIXTURES = {
+    url: fixture_path(family, season)
+    for family, urls in CSV_URLS.items()
+    for season, url in urls.items()
+}
+
+
+def serve_fixtures(latency=0.0):
+    """Route ``utils.disk_cache`` downloads to the local fixture files."""
+    def download(url, headers):
+        if latency:
+            time.sleep(latency)
+        return 200, Message(), FIXTURES[url].read_bytes()
+
+    disk_cache._download = download
+
+
+# --------------------------
+# Widget helpers
+# --------------------------
+def widget(elements, label):
+    for element in elements:
+        if element.label == label:
+            return element
+    raise LookupError(f"No widget labelled {label!r}")
+
+
+def pick(elements, label, index):
+    box = widget(elements, label)
+    option = box.options[index]
+    return box.select(option) if hasattr(box, 'select') else box.set_value(option)
+
+
+def add(elements, label, *indexes):
+    box = widget(elements, label)
+    for index in indexes:
+        box = box.select(box.options[index])
+    return box
+
+
+def narrow(elements, label):
+    slider = widget(elements, label)
+    low, high = slider.value
+    return slider.set_range(low + (high - low) // 4, high)
+
+
+SCENARIOS = {
+    'home': [
+        ('find player', lambda at: widget(at.text_input, "🔎 Find a player").input("Player 12")),
+    ],
+    'passing': [
+        ('select year', lambda at: pick(at.selectbox, "Select Year", 2)),
+        ('highlight players', lambda at: pick(at.multiselect, "Highlight Players", 0)),
+        ('compare players', lambda at: pick(at.selectbox, "Player 2", 1)),
+    ],
+    'rushing': [
+        ('select year', lambda at: pick(at.selectbox, "Select Year", 2)),
+        ('1D slider', lambda at: narrow(at.slider, "Filter by 1D (First Downs)")),
+        ('search player', lambda at: widget(at.text_input, "Search for a player:").input("Player 01")),
+        ('trends view', lambda at: pick(at.radio, "View", 1)),
+        ('trend metric', lambda at: pick(at.selectbox, "Metric", 1)),
+    ],
+    'receiving': [
+        ('select year', lambda at: pick(at.selectbox, "Select Year", 2)),
+        ('min 1D slider', lambda at: widget(at.slider, "Minimum First Downs").set_value(40)),
+    ],
+    'team_dashboard': [
+        ('select year', lambda at: pick(at.selectbox, "Select Year", 2)),
+        ('conference filter', lambda at: pick(at.selectbox, "Select Conference", 1)),
+        ('TOTAL slider', lambda at: narrow(at.slider, "Total First Downs Range")),
+        ('historic team', lambda at: pick(at.selectbox, "Select Team for Historic Chart", 3)),
+    ],
+    'compare_teams': [
+        ('select season', lambda at: pick(at.selectbox, "Select Season", 2)),
+        ('add teams', lambda at: add(at.multiselect, "Choose Teams", 5, 9)),
+        ('similar team', lambda at: pick(at.selectbox, "Find Teams Similar To", 1)),
+    ],
+    'player_career': [
+        ('select player', lambda at: pick(at.selectbox, "Select Player", 7)),
+        ('search player', lambda at: widget(at.text_input, "Search for a player:").input("Player 2")),
+    ],
+}
+
+
+# --------------------------
+# Measurement
+# --------------------------
+def measure(action, track_memory):
+    if track_memory:
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    at = action()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    # Peak allocated during this step, above what was already live.
+    peak_kb = (tracemalloc.get_traced_memory()[1] - before) / 1024 if track_memory else None
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    return at, {'time_ms': elapsed_ms, 'peak_kb': peak_kb}
+
+
+def run_page(page, track_memory, warm_start=False):
+    # Cold: nothing in st.cache_data / st.cache_resource / memcache and an empty disk cache.
+    st.cache_data.clear()
+    st.cache_resource.clear()
+    memcache.CACHE.clear()
+    disk_cache.CACHE_DIR = Path(tempfile.mkdtemp(prefix="firstdown-bench-"))
+    if warm_start:
+        # What the first visitor sees once the server-start prewarm has finished.
+        prewarm.prewarm()
+    at = AppTest.from_file(str(PAGES_DIR / f"{page}.py"), default_timeout=120)
+
+    results = {}
+    at, results['cold run'] = measure(at.run, track_memory)
+    at, results['warm rerun'] = measure(at.run, track_memory)
+    for name, interact in SCENARIOS[page]:
+        at, results[name] = measure(lambda: interact(at).run(), track_memory)
+    return results
+
+
+def run_all(pages, repeat, track_memory, warm_start=False):
+    samples = {page: [] for page in pages}
+    for _ in range(repeat):
+        for page in pages:
+            samples[page].append(run_page(page, track_memory, warm_start))
+
+    # Median over repeats for each metric.
+    results = {}
+    for page, runs in samples.items():
+        results[page] = {}
+        for step in runs[0]:
+            results[page][step] = {
+                metric: (statistics.median(r[step][metric] for r in runs)
+                         if runs[0][step][metric] is not None else None)
+                for metric in runs[0][step]
+            }
+    return results
+
+
+# --------------------------
+# Reporting
+# --------------------------
+def _fmt(value, unit):
+    return "-" if value is None else f"{value:,.1f}{unit}"
+
+
+def report(results, baseline, tolerance):
+    regressions = []
+    print(f"{'page':<16}{'step':<20}{'time':>12}{'peak mem':>14}{'vs baseline':>14}")
+    for page, steps in results.items():
+        for step, metrics in steps.items():
+            base = baseline.get(page, {}).get(step)
+            delta = ""
+            if base and base.get('time_ms'):
+                ratio = metrics['time_ms'] / base['time_ms']
+                delta = f"{(ratio - 1) * 100:+.0f}%"
+                if ratio > 1 + tolerance:
+                    delta += " !"
+                    regressions.append((page, step, ratio))
+            print(f"{page:<16}{step:<20}{_fmt(metrics['time_ms'], 'ms'):>12}"
+                  f"{_fmt(metrics['peak_kb'], 'KB'):>14}{delta:>14}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('pages', nargs='*', default=list(SCENARIOS), help="pages to run (default: all)")
+    parser.add_argument('--repeat', type=int, default=3, help="runs per page; the median is reported")
+    parser.add_argument('--latency', type=float, default=0.0, help="seconds added to every sheet download")
+    parser.add_argument('--no-memory', action='store_true', help="skip tracemalloc for cleaner timings")
+    parser.add_argument('--prewarm', action='store_true', help="run the startup prewarm before each cold run")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="allowed slowdown vs baseline (0.2 = 20%%)")
+    parser.add_argument('--baseline', type=Path, default=BASELINE)
+    parser.add_argument('--save-baseline', action='store_true', help="write results as the new baseline")
+    parser.add_argument('--json', type=Path, help="also write results to this file")
+    args = parser.parse_args(argv)
+
+    serve_fixtures(args.latency)
+    track_memory = not args.no_memory
+    if track_memory:
+        tracemalloc.start()
+
+    results = run_all(args.pages, args.repeat, track_memory, args.prewarm)
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    regressions = report(results, baseline, args.tolerance)
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2))
+        print(f"Baseline saved to {args.baseline}")
+    elif regressions:
+        print(f"{len(regressions)} step(s) slower than baseline by more than {args.tolerance:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,42 @@
+import os
+
+import pandas as pd
+import streamlit as st
+
+from utils.memcache import CACHE, cache_report
+from utils.store import store_report
+
+st.set_page_config(page_title="Cache Admin", layout="wide")
+
+# Server-side switch only: the page lists cache keys and can clear every
+# cache, so a URL parameter must not be enough to open it.
+if os.environ.get("FIRSTDOWN_ADMIN") != "1":
+    st.info("The cache admin view is disabled. Start the server with `FIRSTDOWN_ADMIN=1` to enable it.")
+    st.stop()
+
+st.title("🗄️ Cache Admin")
+
+report = cache_report()
+MB = 2**20
+
+col1, col2, col3 = st.columns(3)
+col1.metric("Cache Used", f"{report['total_bytes'] / MB:,.1f} MB")
+col2.metric("Budget", f"{report['max_bytes'] / MB:,.0f} MB")
+col3.metric("Entries", len(report['entries']))
+
+st.markdown("### Per Cache")
+stats = pd.DataFrame(report['stats'])
+if not stats.empty:
+    stats['hit rate'] = (stats['hits'] / (stats['hits'] + stats['misses'])).round(3)
+st.dataframe(stats, hide_index=True, width='stretch')
+
+st.markdown("### Entries")
+st.dataframe(pd.DataFrame(report['entries']), hide_index=True, width='stretch')
+
+st.markdown("### Stores")
+st.caption("Consolidated stores are held outside the byte budget and replaced by the refresher.")
+st.dataframe(pd.DataFrame(store_report()), hide_index=True, width='stretch')
+
+if st.button("Clear memcache"):
+    CACHE.clear()
+    st.rerun()
@@ -1,31 +1,17 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
+
+from utils.prewarm import start_prewarm
+from utils.similarity import distance_matrix, get_similarity, most_similar
+from utils.sources import CSV_URLS
+from utils.teams import load_team_season
+from utils.timing import PageTimer
 
 st.set_page_config(page_title="Compare NFL Teams", layout="wide")
+timer = PageTimer("compare_teams")
+start_prewarm()
 
 # CSV URLs by year
-csv_urls = {
-    '2024': "https://docs.google.com/spreadsheets/d/e/2PACX-1vQ8nXQrw7rxiNxNFCHAcmPcZsKzH3f_CnYX7ZIijsduJ-suI4lPUyxbAL0HFH14E7xMv5IW-Ov8t6cM/pub?gid=0&single=true&output=csv",
-    '2023': "https://docs.google.com/spreadsheets/d/e/2PACX-1vQ8nXQrw7rxiNxNFCHAcmPcZsKzH3f_CnYX7ZIijsduJ-suI4lPUyxbAL0HFH14E7xMv5IW-Ov8t6cM/pub?gid=891552912&single=true&output=csv",
-    '2022': "https://docs.google.com/spreadsheets/d/e/2PACX-1vQ8nXQrw7rxiNxNFCHAcmPcZsKzH3f_CnYX7ZIijsduJ-suI4lPUyxbAL0HFH14E7xMv5IW-Ov8t6cM/pub?gid=1500595878&single=true&output=csv",
-    '2021': "https://docs.google.com/spreadsheets/d/e/2PACX-1vQ8nXQrw7rxiNxNFCHAcmPcZsKzH3f_CnYX7ZIijsduJ-suI4lPUyxbAL0HFH14E7xMv5IW-Ov8t6cM/pub?gid=1119294445&single=true&output=csv",
-    '2020': "https://docs.google.com/spreadsheets/d/e/2PACX-1vQ8nXQrw7rxiNxNFCHAcmPcZsKzH3f_CnYX7ZIijsduJ-suI4lPUyxbAL0HFH14E7xMv5IW-Ov8t6cM/pub?gid=1068926879&single=true&output=csv",
-}
-
-team_conference = {
-    'Detroit Lions': 'NFC', 'Tampa Bay Buccaneers': 'NFC', 'Baltimore Ravens': 'AFC',
-    'Washington Commanders': 'NFC', 'Cincinnati Bengals': 'AFC', 'Buffalo Bills': 'AFC',
-    'Philadelphia Eagles': 'NFC', 'Atlanta Falcons': 'NFC', 'Arizona Cardinals': 'NFC',
-    'Minnesota Vikings': 'NFC', 'San Francisco 49ers': 'NFC', 'Kansas City Chiefs': 'AFC',
-    'Miami Dolphins': 'AFC', 'Green Bay Packers': 'NFC', 'Los Angeles Rams': 'NFC',
-    'Seattle Seahawks': 'NFC', 'Dallas Cowboys': 'NFC', 'Pittsburgh Steelers': 'AFC',
-    'Los Angeles Chargers': 'AFC', 'Denver Broncos': 'AFC', 'Indianapolis Colts': 'AFC',
-    'New York Jets': 'AFC', 'Las Vegas Raiders': 'AFC', 'Tennessee Titans': 'AFC',
-    'Houston Texans': 'AFC', 'New Orleans Saints': 'NFC', 'Cleveland Browns': 'AFC',
-    'New England Patriots': 'AFC', 'New York Giants': 'NFC', 'Jacksonville Jaguars': 'AFC',
-    'Chicago Bears': 'NFC', 'Carolina Panthers': 'NFC',
-}
+csv_urls = CSV_URLS['teams']
 
 st.title("🏈 Compare NFL Teams by First Downs")
 
@@ -33,24 +19,26 @@ st.title("🏈 Compare NFL Teams by First Downs")
 year = st.selectbox("Select Season", options=sorted(csv_urls.keys(), reverse=True))
 
 # Load data
-df = pd.read_csv(csv_urls[year])
-df['Conference'] = df['TEAM'].map(team_conference)
+df = load_team_season(year)
+timer.lap("load")
 
 # Team selection
-team_choices = df['TEAM'].sort_values().unique()
-team1, team2 = st.columns(2)
-with team1:
-    selected_team_1 = st.selectbox("Choose First Team", team_choices, index=0)
-with team2:
-    selected_team_2 = st.selectbox("Choose Second Team", team_choices, index=1)
-
-# Data subset
-df_compare = df[df['TEAM'].isin([selected_team_1, selected_team_2])]
+team_choices = df['TEAM'].sort_values().unique().tolist()
+selected_teams = st.multiselect("Choose Teams", team_choices, default=team_choices[:2])
+if not selected_teams:
+    st.info("Pick at least one team.")
+    timer.finish()
+    st.stop()
+
+# One indexed lookup for every selected team instead of a filter per team
+df_compare = df.set_index('TEAM').loc[selected_teams].reset_index()
 categories = ['TOTAL', 'PASS', 'RUSH', 'PEN']
 
 
 # Vertical bar chart comparison with value labels
-st.markdown(f"### {year} First Down Comparison: {selected_team_1} vs {selected_team_2}")
+import plotly.express as px
+
+st.markdown(f"### {year} First Down Comparison: {' vs '.join(selected_teams)}")
 
 # Melt dataframe to long format for plotting
 df_melted = df_compare.melt(
@@ -59,6 +47,7 @@ df_melted = df_compare.melt(
     var_name="Type",
     value_name="Count"
 )
+df_melted["TEAM"] = df_melted["TEAM"].astype(str)
 
 # Create vertical bar chart
 fig_compare = px.bar(
@@ -81,18 +70,62 @@ fig_compare.update_layout(
     legend_title="Team"
 )
 
-st.plotly_chart(fig_compare, use_container_width=True)
+st.plotly_chart(fig_compare, width='stretch')
+timer.lap("comparison chart")
 
-# Optional: pie charts side-by-side
+# Optional: pie charts side-by-side, up to four per row
 st.markdown("### Distribution Breakdown (Rush vs Pass vs Penalty)")
-col1, col2 = st.columns(2)
-
-for i, team in enumerate([selected_team_1, selected_team_2]):
-    team_row = df[df["TEAM"] == team].iloc[0]
-    pie = px.pie(
-        names=["Rush", "Pass", "Penalty"],
-        values=[team_row["RUSH"], team_row["PASS"], team_row["PEN"]],
-        title=team,
-        color_discrete_map={'Rush': '#1f77b4', 'Pass': '#ff7f0e', 'Penalty': '#2ca02c'}
+PIES_PER_ROW = 4
+for row_start in range(0, len(df_compare), PIES_PER_ROW):
+    row = df_compare.iloc[row_start:row_start + PIES_PER_ROW]
+    for col, team_row in zip(st.columns(PIES_PER_ROW), row.itertuples(index=False)):
+        pie = px.pie(
+            names=["Rush", "Pass", "Penalty"],
+            values=[team_row.RUSH, team_row.PASS, team_row.PEN],
+            title=str(team_row.TEAM),
+            color_discrete_map={'Rush': '#1f77b4', 'Pass': '#ff7f0e', 'Penalty': '#2ca02c'}
+        )
+        col.plotly_chart(pie, width='stretch')
+
+timer.lap("pie charts")
+
+
+# --------------------------
+# Team Similarity
+# --------------------------
+sim = get_similarity()
+
+if len(selected_teams) > 1:
+    st.markdown(f"### 🧭 Profile Distance Between Selected Teams ({year})")
+    heatmap = px.imshow(
+        distance_matrix(sim, selected_teams, year).round(2),
+        x=selected_teams,
+        y=selected_teams,
+        text_auto=True,
+        color_continuous_scale='Blues_r',
+        labels={'color': 'Distance'},
+    )
+    st.plotly_chart(heatmap, width='stretch')
+
+
+# Runs as a fragment: picking a team reruns only the similarity table.
+@st.fragment
+def similar_teams_section(sim, teams, year):
+    st.markdown("### 🔍 Most Similar Team-Seasons (All Years)")
+    st.caption("Closest TOTAL / PASS / RUSH / PEN profiles, each metric standardised across every team-season.")
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        team = st.selectbox("Find Teams Similar To", teams)
+    with col2:
+        k = st.number_input("How Many", min_value=1, max_value=20, value=5)
+
+    matches = most_similar(sim, team, year, k)
+    st.dataframe(
+        [{'Team': other, 'Season': season, 'Distance': round(dist, 2)} for other, season, dist in matches],
+        hide_index=True,
+        width='stretch',
     )
-    (col1 if i == 0 else col2).plotly_chart(pie, use_container_width=True)
+
+similar_teams_section(sim, selected_teams, year)
+timer.lap("similarity")
+timer.finish()
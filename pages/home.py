@@ -1,6 +1,10 @@
 import streamlit as st
 
+from utils.prewarm import start_prewarm
+from utils.search import POSITIONS, get_player_index
+
 st.set_page_config(page_title="First Down | Home", layout="wide")
+start_prewarm()
 
 st.markdown(
     """
@@ -39,4 +43,18 @@ st.markdown(
     </div>
     """,
     unsafe_allow_html=True,
-)
\ No newline at end of file
+)
+
+# --- Player Finder ---
+# Searches every season of the passing, rushing and receiving data at once.
+query = st.text_input("🔎 Find a player", placeholder="e.g. Mahomes, J. Jeff, kelce")
+if query:
+    hits = get_player_index().search(query, limit=10)
+    if not hits:
+        st.info("No players found.")
+    for hit in hits:
+        seasons = {}
+        for family, season in hit['rows']:
+            seasons.setdefault(POSITIONS[family], []).append(str(season))
+        found_in = " · ".join(f"{position}: {', '.join(years)}" for position, years in seasons.items())
+        st.markdown(f"**{hit['name']}** — {found_in}")
@@ -1,23 +1,25 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-import base64
+
+from utils.cards import render_rank_list
+from utils.highlights import get_highlights, render_highlights
+from utils.leaderboard import get_ranked_season, top_n
+from utils.prewarm import start_prewarm
+from utils.search import get_player_index
+from utils.sources import CSV_URLS
+from utils.tables import COLUMN_CONFIG, paged_table
+from utils.timing import PageTimer
 
 st.set_page_config(layout="centered")  # or leave as wide if you want
+timer = PageTimer("passing")
+start_prewarm()
 st.sidebar.markdown("""
 ### 🔍 About This Page
 Dive deep into NFL passing first downs. Track performance by year, player, and key efficiency metrics.
 """)
 
 # URLs for each year's data CSV
-csv_urls = {
-    '2024': "https://docs.google.com/spreadsheets/d/e/2PACX-1vS_MsjqbDCt5ffmLWWZ0c-pPjkFwoUT6TmQdSo1m4peXEO42c9wTs3V4C5lw9VyRXaeexUB7nFJCZLe/pub?gid=1348857990&single=true&output=csv",
-    '2023': "https://docs.google.com/spreadsheets/d/e/2PACX-1vS_MsjqbDCt5ffmLWWZ0c-pPjkFwoUT6TmQdSo1m4peXEO42c9wTs3V4C5lw9VyRXaeexUB7nFJCZLe/pub?gid=1490524640&single=true&output=csv",
-    '2022': "https://docs.google.com/spreadsheets/d/e/2PACX-1vS_MsjqbDCt5ffmLWWZ0c-pPjkFwoUT6TmQdSo1m4peXEO42c9wTs3V4C5lw9VyRXaeexUB7nFJCZLe/pub?gid=1282758623&single=true&output=csv",
-    '2021': "https://docs.google.com/spreadsheets/d/e/2PACX-1vS_MsjqbDCt5ffmLWWZ0c-pPjkFwoUT6TmQdSo1m4peXEO42c9wTs3V4C5lw9VyRXaeexUB7nFJCZLe/pub?gid=498746140&single=true&output=csv",
-    '2020': "https://docs.google.com/spreadsheets/d/e/2PACX-1vS_MsjqbDCt5ffmLWWZ0c-pPjkFwoUT6TmQdSo1m4peXEO42c9wTs3V4C5lw9VyRXaeexUB7nFJCZLe/pub?gid=2108600758&single=true&output=csv",
-}
+csv_urls = CSV_URLS['passing']
 
 st.title("🏈 QB First Down Kings | NFL Passing Breakdown")
 st.markdown("Get seamless and interactive visualizations of NFL quarterbacks' first down passing stats across seasons.")
@@ -25,135 +27,47 @@ st.markdown("Get seamless and interactive visualizations of NFL quarterbacks' fi
 # Move year selector here, not sidebar
 year = st.selectbox("Select Year", options=sorted(csv_urls.keys(), reverse=True))
 
-@st.cache_data
-def load_data(year):
-    url = csv_urls[year]
-    df = pd.read_csv(url)
-    df.columns = df.columns.str.strip()
-
-    # Clean percentage columns
-    pct_cols = ['First Down Rate', 'Succ%']
-    for col in pct_cols:
-        if col in df.columns:
-            df[col] = df[col].astype(str).str.rstrip('%').replace('nan', None)
-            df[col] = pd.to_numeric(df[col], errors='coerce')
-
-    # Convert numeric columns
-    numeric_cols = ['G', 'Age', 'Cmp', 'Att', 'Yds', 'TD', 'Int', '1D',
-                    'Yards per First Down', 'First Down Rate per Game', 'Rate', 'QBR']
-    for col in numeric_cols:
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors='coerce')
-
-    return df
-
-df = load_data(year)
+df, board = get_ranked_season('passing', year)
+timer.lap("load")
 
 
 # top 5 cards
-top_5 = df.sort_values('1D', ascending=False).head(5).reset_index(drop=True)
+top_5 = top_n(df, board, '1D', 5).reset_index(drop=True)
 
 st.markdown("### 🏆 Top 5 QB by First Downs (1D)")
 
-medals = {
-    0: "🥇",  # Gold
-    1: "🥈",  # Silver
-    2: "🥉",  # Bronze
-}
-
-max_1d = top_5['1D'].max()
-
-st.markdown("""
-<style>
-.top-list-item {
-    padding: 0.3rem 0.6rem;
-    border-radius: 6px;
-    margin-bottom: 0.3rem;
-    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-    color: white;
-    font-size: 0.9rem;
-    display: flex;
-    justify-content: space-between;
-    align-items: center;
-    position: relative;
-    overflow: hidden;
-}
-.gold {
-    background: linear-gradient(90deg, #FFD700, #FFC107);
-}
-.silver {
-    background: linear-gradient(90deg, #C0C0C0, #A9A9A9);
-}
-.bronze {
-    background: linear-gradient(90deg, #CD7F32, #B87333);
-}
-.others {
-    background: linear-gradient(90deg, #4a90e2, #357ABD);
-}
-/* Bar behind the 1D number */
-.bar {
-    position: absolute;
-    left: 0;
-    top: 0;
-    bottom: 0;
-    z-index: 0;
-    opacity: 0.3;
-    border-radius: 6px;
-}
-/* Text container above the bar */
-.text-content {
-    position: relative;
-    z-index: 1;
-    width: 100%;
-    display: flex;
-    justify-content: space-between;
-    align-items: center;
-}
-</style>
-""", unsafe_allow_html=True)
-
-for i, row in top_5.iterrows():
-    medal = medals.get(i, f"{i+1}.")
-    if i == 0:
-        css_class = "top-list-item gold"
-        bar_color = "rgba(255, 215, 0, 0.7)"  # gold
-    elif i == 1:
-        css_class = "top-list-item silver"
-        bar_color = "rgba(192, 192, 192, 0.7)"  # silver
-    elif i == 2:
-        css_class = "top-list-item bronze"
-        bar_color = "rgba(205, 127, 50, 0.7)"  # bronze
-    else:
-        css_class = "top-list-item others"
-        bar_color = "rgba(74, 144, 226, 0.7)"  # blue
-
-    # Calculate bar width as percentage of max 1D, min width for visibility
-    bar_width_pct = max(10, (row['1D'] / max_1d) * 100)
-
-    st.markdown(f"""
-        <div class="{css_class}">
-            <div class="bar" style="width: {bar_width_pct}%; background-color: {bar_color};"></div>
-            <div class="text-content">
-                <span><strong>{medal} {row['Player']}</strong></span>
-                <span>1D: <strong>{int(row['1D'])}</strong></span>
-            </div>
-        </div>
-    """, unsafe_allow_html=True)
+render_rank_list(top_5['Player'], top_5['1D'], "1D")
+
+timer.lap("top cards")
+
+st.markdown("### 🏆 Top Highlights for " + year)
+render_highlights(get_highlights('passing', year))
+timer.lap("highlights")
 
 
 
 
 # --- Data Preview ---
-df_sorted = df.sort_values('1D', ascending=False).reset_index(drop=True)
+df_sorted = top_n(df, board, '1D').reset_index(drop=True)
 df_sorted.index = df_sorted.index + 1
 
 st.write(f"### Data Preview ({year} Season)")
-st.dataframe(df_sorted)
+paged_table(
+    df_sorted,
+    key="passing_table",
+    column_config=COLUMN_CONFIG['passing'],
+    search_column='Player',
+    search_label="Search for a player:",
+    matcher=get_player_index().matching_names,
+)
+timer.lap("table")
 
 
 
 # --- Top 10 QBs – Passing First Downs ---
-top_qbs = df.sort_values('1D', ascending=True).tail(10)
+import plotly.graph_objects as go
+
+top_qbs = top_n(df, board, '1D', 10).iloc[::-1]
 
 fig = go.Figure()
 
@@ -192,97 +106,111 @@ fig.update_layout(
     font=dict(color='white')
 )
 
-st.plotly_chart(fig, use_container_width=True)
+st.plotly_chart(fig, width='stretch')
+timer.lap("top-10 chart")
 
 
 
 # --- Interactive Scatter Plot ---
-st.write("### Yards per First Down vs. First Down Rate")
-selected_players = st.multiselect("Highlight Players", options=df['Player'].unique())
-
-fig = px.scatter(
-    df,
-    x='First Down Rate',
-    y='Yards per First Down',
-    hover_data=['Player'],
-    title='Yards per First Down vs. First Down Rate',
-    labels={'First Down Rate': 'First Down Rate (%)', 'Yards per First Down': 'Yards per First Down'}
-)
-
-if selected_players:
-    highlighted = df[df['Player'].isin(selected_players)]
-    fig.add_scatter(
-        x=highlighted['First Down Rate'],
-        y=highlighted['Yards per First Down'],
-        mode='markers+text',
-        text=highlighted['Player'],
-        textposition='top center',
-        marker=dict(color='red', size=12),
-        name='Selected Players'
+# Runs as a fragment: changing the highlighted players reruns only this chart.
+@st.fragment
+def scatter_section(df):
+    import plotly.express as px
+
+    st.write("### Yards per First Down vs. First Down Rate")
+    selected_players = st.multiselect("Highlight Players", options=df['Player'].unique())
+
+    fig = px.scatter(
+        df,
+        x='First Down Rate',
+        y='Yards per First Down',
+        hover_data=['Player'],
+        title='Yards per First Down vs. First Down Rate',
+        labels={'First Down Rate': 'First Down Rate (%)', 'Yards per First Down': 'Yards per First Down'}
     )
 
-st.plotly_chart(fig, use_container_width=True)
+    if selected_players:
+        highlighted = df[df['Player'].isin(selected_players)]
+        fig.add_scatter(
+            x=highlighted['First Down Rate'],
+            y=highlighted['Yards per First Down'],
+            mode='markers+text',
+            text=highlighted['Player'],
+            textposition='top center',
+            marker=dict(color='red', size=12),
+            name='Selected Players'
+        )
 
+    st.plotly_chart(fig, width='stretch')
 
+scatter_section(df)
+timer.lap("scatter")
 
 
 
 
-# --- Compare Two Players ---
-st.write("### 🆚 Compare Two Players")
-
-col1, col2 = st.columns(2)
-players = df['Player'].unique()
-with col1:
-    player1 = st.selectbox("Player 1", players, key='player1')
-with col2:
-    player2 = st.selectbox("Player 2", players, key='player2')
-
-if player1 and player2 and player1 != player2:
-    stats1 = df[df['Player'] == player1].iloc[0]
-    stats2 = df[df['Player'] == player2].iloc[0]
-
-    # Choose relevant stats to compare
-    stat_cols = ['1D', 'Cmp', 'Att', 'Yds', 'TD', 'Int', 'Rate', 'QBR']
-    comparison_df = pd.DataFrame({
-        'Stat': stat_cols,
-        player1: [stats1[stat] for stat in stat_cols],
-        player2: [stats2[stat] for stat in stat_cols]
-    })
-
-    st.write("#### 📊 Stat Comparison")
-    st.dataframe(comparison_df.set_index('Stat'), use_container_width=True)
-
-    # Optional: Visual chart
-    import plotly.graph_objects as go
-
-    fig = go.Figure()
-    fig.add_trace(go.Bar(
-        x=comparison_df[player1],
-        y=comparison_df['Stat'],
-        orientation='h',
-        name=player1,
-        marker_color='steelblue'
-    ))
-    fig.add_trace(go.Bar(
-        x=comparison_df[player2],
-        y=comparison_df['Stat'],
-        orientation='h',
-        name=player2,
-        marker_color='orange'
-    ))
-
-    fig.update_layout(
-        barmode='group',
-        title_text='Side-by-Side Player Comparison',
-        plot_bgcolor='black',
-        paper_bgcolor='black',
-        font=dict(color='white'),
-        height=400,
-        margin=dict(t=30, b=30, l=30, r=30),
-    )
 
-    st.plotly_chart(fig, use_container_width=True)
+
+# --- Compare Two Players ---
+# Runs as a fragment: picking either player reruns only the comparison.
+@st.fragment
+def compare_section(df):
+    st.write("### 🆚 Compare Two Players")
+
+    col1, col2 = st.columns(2)
+    players = df['Player'].unique()
+    with col1:
+        player1 = st.selectbox("Player 1", players, key='player1')
+    with col2:
+        player2 = st.selectbox("Player 2", players, key='player2')
+
+    if player1 and player2 and player1 != player2:
+        stats1 = df[df['Player'] == player1].iloc[0]
+        stats2 = df[df['Player'] == player2].iloc[0]
+
+        # Choose relevant stats to compare
+        stat_cols = ['1D', 'Cmp', 'Att', 'Yds', 'TD', 'Int', 'Rate', 'QBR']
+        comparison_df = pd.DataFrame({
+            'Stat': stat_cols,
+            player1: [stats1[stat] for stat in stat_cols],
+            player2: [stats2[stat] for stat in stat_cols]
+        })
+
+        st.write("#### 📊 Stat Comparison")
+        st.dataframe(comparison_df.set_index('Stat'), width='stretch')
+
+        # Optional: Visual chart
+        fig = go.Figure()
+        fig.add_trace(go.Bar(
+            x=comparison_df[player1],
+            y=comparison_df['Stat'],
+            orientation='h',
+            name=player1,
+            marker_color='steelblue'
+        ))
+        fig.add_trace(go.Bar(
+            x=comparison_df[player2],
+            y=comparison_df['Stat'],
+            orientation='h',
+            name=player2,
+            marker_color='orange'
+        ))
+
+        fig.update_layout(
+            barmode='group',
+            title_text='Side-by-Side Player Comparison',
+            plot_bgcolor='black',
+            paper_bgcolor='black',
+            font=dict(color='white'),
+            height=400,
+            margin=dict(t=30, b=30, l=30, r=30),
+        )
+
+        st.plotly_chart(fig, width='stretch')
+
+compare_section(df)
+timer.lap("compare")
+timer.finish()
 
 
 
@@ -0,0 +1,75 @@
+import streamlit as st
+
+from utils.players import CAREER_COLUMNS, get_player_tables, player_career
+from utils.prewarm import start_prewarm
+from utils.search import get_player_index
+from utils.timing import PageTimer
+
+st.set_page_config(page_title="Player Careers", layout="wide")
+timer = PageTimer("player_career")
+start_prewarm()
+st.sidebar.markdown("""
+### 🔍 About This Page
+Follow a player's first downs across every season, passing, rushing and receiving combined.
+""")
+
+st.title("📈 Player Career First Downs")
+
+dim, ids, careers = get_player_tables()
+timer.lap("load")
+
+# Narrow the player list with the search index, then pick one.
+query = st.text_input("Search for a player:")
+if query:
+    # The index and the tables are built from separate store reads; a refresh in
+    # between can index a new name the tables don't have yet, so keep only known ids.
+    hits = [hit['name'] for hit in get_player_index().search(query, limit=50)]
+    options = [name for name in hits if name in ids.index]
+else:
+    options = dim['Player'].tolist()
+
+if not options:
+    st.info("No players found.")
+    timer.finish()
+    st.stop()
+
+player = st.selectbox("Select Player", options)
+player_id = ids[player]
+profile = dim.loc[player_id]
+career = player_career(careers, player_id)
+timer.lap("lookup")
+
+# --- Profile ---
+col1, col2, col3 = st.columns(3)
+col1.metric("Seasons", int(profile['Seasons']))
+col2.metric("Career First Downs", int(career.to_numpy().sum()))
+col3.metric("Active", f"{profile['First Season']}–{profile['Last Season']}")
+st.caption(f"Teams: {profile['Teams']}")
+
+# --- Career chart ---
+import plotly.graph_objects as go
+
+colors = {'passing': 'steelblue', 'rushing': 'seagreen', 'receiving': 'orange'}
+fig = go.Figure()
+for family, column in CAREER_COLUMNS.items():
+    if career[column].any():
+        fig.add_trace(go.Bar(
+            x=career.index.astype(str),
+            y=career[column],
+            name=column,
+            marker_color=colors[family],
+        ))
+
+fig.update_layout(
+    barmode='stack',
+    title=f"{player} – First Downs by Season",
+    xaxis=dict(title="Season", type='category'),
+    yaxis=dict(title="First Downs"),
+    height=450,
+)
+st.plotly_chart(fig, width='stretch')
+timer.lap("career chart")
+
+st.dataframe(career, width='stretch')
+timer.lap("table")
+timer.finish()
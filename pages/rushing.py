@@ -1,45 +1,113 @@
 import streamlit as st
-import pandas as pd
-import altair as alt
+
+from utils.cards import ORDINALS, PASTEL_GRADIENTS, render_card_strip
+from utils.highlights import get_highlights, render_highlights
+from utils.leaderboard import get_ranked_season, top_n
+from utils.memcache import cached
+from utils.prewarm import start_prewarm
+from utils.search import get_player_index
+from utils.sources import CSV_URLS
+from utils.store import load_store, stacked_frame
+from utils.tables import COLUMN_CONFIG, paged_table
+from utils.timing import PageTimer
 
 # --------------------------
 # URLs for CSV by year
 # --------------------------
-csv_urls = {
-    '2024': "https://docs.google.com/spreadsheets/d/e/2PACX-1vRf8IihZAe5eWGCyglTOuc0TNpYi8M5OY9LmHI90BlGvUTbh4zHQqxZnm_oeioI3SdJnzwLWoYN1qPC/pub?gid=574291986&single=true&output=csv",
-    '2023': "https://docs.google.com/spreadsheets/d/e/2PACX-1vRf8IihZAe5eWGCyglTOuc0TNpYi8M5OY9LmHI90BlGvUTbh4zHQqxZnm_oeioI3SdJnzwLWoYN1qPC/pub?gid=1218519657&single=true&output=csv",
-    '2022': "https://docs.google.com/spreadsheets/d/e/2PACX-1vRf8IihZAe5eWGCyglTOuc0TNpYi8M5OY9LmHI90BlGvUTbh4zHQqxZnm_oeioI3SdJnzwLWoYN1qPC/pub?gid=107479071&single=true&output=csv",
-    '2021': "https://docs.google.com/spreadsheets/d/e/2PACX-1vRf8IihZAe5eWGCyglTOuc0TNpYi8M5OY9LmHI90BlGvUTbh4zHQqxZnm_oeioI3SdJnzwLWoYN1qPC/pub?gid=1376297477&single=true&output=csv",
-    '2020': "https://docs.google.com/spreadsheets/d/e/2PACX-1vRf8IihZAe5eWGCyglTOuc0TNpYi8M5OY9LmHI90BlGvUTbh4zHQqxZnm_oeioI3SdJnzwLWoYN1qPC/pub?gid=1118278232&single=true&output=csv",
-}
+csv_urls = CSV_URLS['rushing']
 
 # --------------------------
 # Streamlit Page Config and Title
 # --------------------------
 st.set_page_config(page_title="NFL Rushing 1D Stats", layout="wide")
+timer = PageTimer("rushing")
+start_prewarm()
 st.title("🏈 NFL Rushing First Down Stats")
 
 # --------------------------
 # Cached Data Loaders
 # --------------------------
-@st.cache_data
-def load_data(url):
-    df = pd.read_csv(url)
-    # Clean 'Rushing First Down Rate' safely
-    df['Rushing First Down Rate'] = pd.to_numeric(df['Rushing First Down Rate'].str.rstrip('%'), errors='coerce').fillna(0)
-    df['YPC'] = (df['Yds'] / df['Att']).round(2)
-    return df
-
-@st.cache_data
-def load_combined_years(years):
-    dfs = []
-    for y in years:
-        df_year = load_data(csv_urls[y])
-        dfs.append(df_year)
-    df_all = pd.concat(dfs, ignore_index=True)
-    return df_all
+@cached(name='rushing_combined_years')
+def _combined_years(_store, years, version):
+    return stacked_frame(_store, years)
 
 
+def load_combined_years(years):
+    # The store fetches every season concurrently; this keeps the stacked
+    # frame for the chosen seasons (per store version) so trend charts don't rebuild it.
+    store = load_store('rushing')
+    return _combined_years(store, years, store.attrs.get('version'))
+
+
+# --------------------------
+# Multi-Season Trends
+# --------------------------
+def league_trends(combined):
+    import altair as alt
+
+    by_season = combined.groupby('Season', observed=True)
+    league = by_season.agg({'1D': 'sum', 'Yds': 'sum', 'Att': 'sum', 'Explosiveness': 'mean'})
+    league['YPC'] = (league['Yds'] / league['Att']).round(2)
+    league['1D Rate'] = (league['1D'] / league['Att'] * 100).round(2)
+    league['Explosiveness'] = league['Explosiveness'].round(2)
+    league = league.reset_index()
+
+    st.markdown("### 📈 League-Wide Rushing Trends")
+    chart_cols = st.columns(3)
+    for col, (metric, title) in zip(chart_cols, [
+        ('1D', 'Total Rushing First Downs'),
+        ('YPC', 'League Yards per Carry'),
+        ('1D Rate', 'League 1D Rate (%)'),
+    ]):
+        chart = alt.Chart(league).mark_line(point=True).encode(
+            x=alt.X('Season:O', title=None),
+            y=alt.Y(f'{metric}:Q', title=None, scale=alt.Scale(zero=False)),
+            tooltip=['Season', metric],
+        ).properties(title=title, height=250)
+        col.altair_chart(chart, width='stretch')
+
+
+# Runs as a fragment: picking players or a metric reruns only this chart.
+@st.fragment
+def player_trends(combined):
+    import altair as alt
+
+    st.markdown("### 🏃 Player Trends")
+    totals = combined.groupby('Player', observed=True)['1D'].sum().sort_values(ascending=False)
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        players = st.multiselect("Compare Players", options=totals.index.tolist(),
+                                 default=totals.index[:3].tolist())
+    with col2:
+        metric = st.selectbox("Metric", ['YPC', 'Rushing First Down Rate', 'Explosiveness', '1D'])
+
+    if not players:
+        st.info("Pick at least one player.")
+        return
+    subset = combined[combined['Player'].isin(players)]
+    chart = alt.Chart(subset).mark_line(point=True).encode(
+        x=alt.X('Season:O', title='Season'),
+        y=alt.Y(f'{metric}:Q', title=metric, scale=alt.Scale(zero=False)),
+        color=alt.Color('Player:N'),
+        tooltip=['Player', 'Season', 'Team', metric],
+    )
+    st.altair_chart(chart, width='stretch')
+
+
+view = st.radio("View", ["Single Season", "Multi-Season Trends"], horizontal=True)
+if view == "Multi-Season Trends":
+    seasons = st.multiselect("Seasons", options=sorted(csv_urls.keys()), default=sorted(csv_urls.keys()))
+    if not seasons:
+        st.info("Pick at least one season.")
+    else:
+        combined = load_combined_years(tuple(sorted(seasons)))
+        timer.lap("load")
+        league_trends(combined)
+        timer.lap("league trends")
+        player_trends(combined)
+        timer.lap("player trends")
+    timer.finish()
+    st.stop()
 
 # --------------------------
 # Filter Section for Single Year View
@@ -49,10 +117,11 @@ with col1:
     year = st.selectbox("Select Year", options=sorted(csv_urls.keys(), reverse=True))
 
 # Load data for selected year
-df = load_data(csv_urls[year])
-df_sorted = df.sort_values(by="1D", ascending=False).reset_index(drop=True)
+df, board = get_ranked_season('rushing', year)
+df_sorted = top_n(df, board, '1D').reset_index(drop=True)
 df_sorted.index = df_sorted.index + 1
 df_sorted.index.name = "Rank"
+timer.lap("load")
 
 # Slider filter for 1D
 min_1d = int(df_sorted['1D'].min())
@@ -71,65 +140,17 @@ filtered_df = df_sorted[
 st.markdown(f"<h2 style='color:#1f77b4;'>🏃‍♂️ Top 5 Players in Rushing 1D ({year})</h2>", unsafe_allow_html=True)
 
 top5 = df_sorted.head(5)
-card_cols = st.columns(5)
-
-rushing_gradients = [
-    "linear-gradient(135deg, #E3F2FD, #BBDEFB)",
-    "linear-gradient(135deg, #E8F5E9, #A5D6A7)",
-    "linear-gradient(135deg, #FFF3E0, #FFCC80)",
-    "linear-gradient(135deg, #F3E5F5, #CE93D8)",
-    "linear-gradient(135deg, #ECEFF1, #B0BEC5)",
-]
-
-ordinal_suffixes = ["1st 🥇", "2nd 🥈", "3rd 🥉", "4th", "5th"]
-
-for i, (index, row) in enumerate(top5.iterrows()):
-    player = row["Player"]
-    one_d = row["1D"]
-    rank_label = ordinal_suffixes[i]
-
-    with card_cols[i]:
-        st.markdown(
-            f"""
-            <div style="
-                background: {rushing_gradients[i]};
-                padding: 10px 12px;
-                border-radius: 12px;
-                box-shadow: 0 3px 8px rgba(0,0,0,0.2);
-                text-align: center;
-                color: #222;
-                font-weight: 600;
-                min-width: 200px;
-                margin: 0 auto;
-            ">
-                <p style='
-                    margin: 0 0 6px 0; 
-                    font-size: 16px; 
-                    font-weight: 700; 
-                    color: #333;
-                    letter-spacing: 1px;
-                '>{rank_label}</p>
-                <h4 style='
-                    margin: 0 0 6px 0; 
-                    font-size: 20px; 
-                    font-weight: 900; 
-                    color: #111; 
-                    text-transform: uppercase;
-                '>{player}</h4>
-                <p style='font-size:18px; margin: 4px 0; color: #0d47a1; font-weight:700;'>
-                    {one_d} 1D
-                </p>
-            </div>
-            """,
-            unsafe_allow_html=True
-        )
+render_card_strip(top5["Player"], top5["1D"], "1D", PASTEL_GRADIENTS, ranks=ORDINALS)
 
 st.markdown("<br><br>", unsafe_allow_html=True)
+timer.lap("top cards")
 
 
 # --------------------------
 # Top 10 Bar Chart Section
 # --------------------------
+import altair as alt
+
 top10 = filtered_df.head(10).copy()
 top10['1D'] = top10['1D'].astype(float)
 
@@ -152,49 +173,17 @@ text = alt.Chart(top10).mark_text(
 
 final_chart = bar_chart + text
 
-st.altair_chart(final_chart, use_container_width=True)
+st.altair_chart(final_chart, width='stretch')
+timer.lap("top-10 chart")
 
 # --------------------------
 # Year Highlights
 # --------------------------
-# Aggregate stats for selected year
-num_cols = ['1D', 'Rushing First Down Rate', 'Explosiveness', 'Att', 'Yds']
-df_sorted[num_cols] = df_sorted[num_cols].apply(pd.to_numeric, errors='coerce').fillna(0)
-agg = df_sorted.groupby('Player').agg({
-    '1D': 'sum',
-    'Rushing First Down Rate': 'mean',
-    'Explosiveness': 'mean',
-    'Att': 'sum',
-    'Yds': 'sum',
-}).reset_index()
-agg['YPC'] = agg['Yds'] / agg['Att']
-agg_filtered = agg[agg['Att'] >= 100]
-
-# Get top players by metric for the selected year
-top = {
-    'Most 1D': agg.loc[agg['1D'].idxmax()],
-    'Highest 1D Rate': agg.loc[agg['Rushing First Down Rate'].idxmax()],
-    'Highest Explosiveness': agg.loc[agg['Explosiveness'].idxmax()],
-    'Most Attempts': agg.loc[agg['Att'].idxmax()],
-    'Most Yards': agg.loc[agg['Yds'].idxmax()],
-    'Highest YPC (100+ Att)': agg_filtered.loc[agg_filtered['YPC'].idxmax()],
-}
-
-# Display summary below cards
-summary_html = f"""
-<ul style="font-size: 14px; line-height: 1.3; padding-left: 1.2em; margin-top: 0; margin-bottom: 0;">
-  <li><b>Most 1D:</b> {top['Most 1D']['Player']} ({int(top['Most 1D']['1D'])})</li>
-  <li><b>Highest 1D Rate:</b> {top['Highest 1D Rate']['Player']} ({top['Highest 1D Rate']['Rushing First Down Rate']:.2f}%)</li>
-  <li><b>Highest Explosiveness:</b> {top['Highest Explosiveness']['Player']} ({top['Highest Explosiveness']['Explosiveness']:.2f})</li>
-  <li><b>Most Attempts:</b> {top['Most Attempts']['Player']} ({int(top['Most Attempts']['Att'])})</li>
-  <li><b>Most Yards:</b> {top['Most Yards']['Player']} ({int(top['Most Yards']['Yds'])})</li>
-  <li><b>Highest YPC (100+ Att):</b> {top['Highest YPC (100+ Att)']['Player']} ({top['Highest YPC (100+ Att)']['YPC']:.2f})</li>
-</ul>
-"""
-
+# Leaders per metric, precomputed once per season in utils.highlights
 st.markdown("### 🏆 Top Highlights for " + year)
-st.markdown(summary_html, unsafe_allow_html=True)
+render_highlights(get_highlights('rushing', year))
 st.markdown("---")
+timer.lap("highlights")
 
 
 
@@ -210,22 +199,16 @@ To view a different season, use the <em>Select Year</em> dropdown above.
 </p>
 """, unsafe_allow_html=True)
 
-search_term = st.text_input("Search for a player:")
-
-df_display = filtered_df.copy()
-if search_term:
-    df_display = df_display[df_display['Player'].str.contains(search_term, case=False, na=False)]
-
-df_display = df_display.reset_index(drop=True)
-df_display.index += 1
-df_display.index.name = 'Rank'
-
-st.dataframe(
-    df_display.style
-        .format({'Rushing First Down Rate': '{:.2f}%', 'YPC': '{:.2f}'})
-        .set_properties(**{'text-align': 'left'}),
-    use_container_width=True
+# Paged on the server; searching, sorting and paging rerun only the table.
+paged_table(
+    filtered_df,
+    key="rushing_table",
+    column_config=COLUMN_CONFIG['rushing'],
+    search_column='Player',
+    search_label="Search for a player:",
+    matcher=get_player_index().matching_names,
 )
+timer.lap("table")
 
 # --------------------------
 # Glossary Expander Section
@@ -240,3 +223,5 @@ with st.expander("ℹ️ Glossary"):
     - **Explosiveness**: A metric indicating how impactful a player's first down runs are, reflecting both frequency and yardage.
     """)
 
+timer.finish()
+
@@ -0,0 +1,130 @@
+import urllib.error
+
+import pandas as pd
+import pytest
+
+from utils import disk_cache
+from utils.disk_cache import read_csv_cached
+
+URL = "https://example.invalid/sheet.csv"
+BODY = b"Player,1D\nA,10\nB,20\n"
+
+
+class FakeSheet:
+    """Stands in for ``_download``; records the request headers it was sent."""
+
+    def __init__(self):
+        self.responses = []
+        self.requests = []
+
+    def __call__(self, url, headers):
+        self.requests.append(dict(headers))
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+@pytest.fixture
+def sheet(monkeypatch, tmp_path):
+    fake = FakeSheet()
+    monkeypatch.setattr(disk_cache, 'CACHE_DIR', tmp_path)
+    monkeypatch.setattr(disk_cache, '_download', fake)
+    return fake
+
+
+@pytest.fixture
+def parses(monkeypatch):
+    calls = []
+    parse = disk_cache._parse
+
+    def counting(body, schema):
+        calls.append(body)
+        return parse(body, schema)
+
+    monkeypatch.setattr(disk_cache, '_parse', counting)
+    return calls
+
+
+def _prime(sheet):
+    sheet.responses.append((200, {'ETag': '"v1"'}, BODY))
+    return read_csv_cached(URL)
+
+
+def test_fresh_copy_is_served_without_a_request(sheet):
+    first = _prime(sheet)
+    pd.testing.assert_frame_equal(read_csv_cached(URL), first)
+    assert len(sheet.requests) == 1
+
+
+def test_not_modified_is_served_from_disk(sheet, parses):
+    first = _prime(sheet)
+    sheet.responses.append((304, {}, b""))
+
+    pd.testing.assert_frame_equal(read_csv_cached(URL, max_age=0), first)
+    assert sheet.requests[-1] == {'If-None-Match': '"v1"'}
+    assert len(parses) == 1
+
+
+def test_unchanged_body_is_not_parsed_again(sheet, parses):
+    first = _prime(sheet)
+    sheet.responses.append((200, {}, BODY))
+
+    pd.testing.assert_frame_equal(read_csv_cached(URL, max_age=0), first)
+    assert len(parses) == 1
+
+
+def test_changed_body_replaces_the_disk_copy(sheet):
+    _prime(sheet)
+    sheet.responses.append((200, {'ETag': '"v2"'}, BODY + b"C,30\n"))
+
+    assert len(read_csv_cached(URL, max_age=0)) == 3
+    assert len(read_csv_cached(URL)) == 3
+    assert len(sheet.requests) == 2
+
+
+def test_unreachable_source_falls_back_to_disk(sheet):
+    first = _prime(sheet)
+    sheet.responses.append(urllib.error.URLError("offline"))
+
+    pd.testing.assert_frame_equal(read_csv_cached(URL, max_age=0), first)
+
+
+def test_unreachable_source_without_a_disk_copy_raises(sheet):
+    sheet.responses.append(urllib.error.URLError("offline"))
+    with pytest.raises(urllib.error.URLError):
+        read_csv_cached(URL)
+
+
+def test_write_atomic_replaces_the_file_and_leaves_no_temp(tmp_path):
+    target = tmp_path / "meta.json"
+    disk_cache._write_atomic(target, lambda p: p.write_text("one"))
+    disk_cache._write_atomic(target, lambda p: p.write_text("two"))
+
+    assert target.read_text() == "two"
+    assert [p.name for p in tmp_path.iterdir()] == ["meta.json"]
+
+
+def test_write_atomic_uses_a_temp_file_per_writer(tmp_path):
+    target = tmp_path / "sheet.feather"
+    seen = []
+
+    def nested(outer_tmp):
+        # A second writer starting while the first is mid-write.
+        disk_cache._write_atomic(target, lambda p: (seen.append(p), p.write_text("inner")))
+        seen.append(outer_tmp)
+        outer_tmp.write_text("outer")
+
+    disk_cache._write_atomic(target, nested)
+    assert seen[0] != seen[1]
+    assert target.read_text() == "outer"
+
+
+def test_failed_write_removes_its_temp_file(tmp_path):
+    def fail(path):
+        path.write_text("partial")
+        raise ValueError("bad frame")
+
+    with pytest.raises(ValueError):
+        disk_cache._write_atomic(tmp_path / "sheet.feather", fail)
+    assert list(tmp_path.iterdir()) == []
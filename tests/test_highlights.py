@@ -0,0 +1,36 @@
+import pandas as pd
+
+from utils.highlights import HIGHLIGHTS, build_highlights
+from utils.store import build_store
+
+
+def _receiving(**columns):
+    rows = pd.DataFrame({
+        'Player': ['Tyreek Hill', 'Travis Kelce', 'Tyreek Hill', 'Rookie'],
+        'Team': ['MIA', 'KAN', 'MIA', 'KAN'],
+        '1D': pd.array([40, 50, 30, 5], dtype='Int64'),
+        **columns,
+    })
+    return build_store('receiving', {'2024': rows})
+
+
+def test_leaders_sum_a_players_rows_and_apply_qualifiers():
+    store = _receiving(
+        Rec=pd.array([60, 90, 50, 10], dtype='Int64'),
+        Yds=pd.array([900, 1000, 700, 300], dtype='Int64'),
+        TD=pd.array([6, 5, 4, 1], dtype='Int64'),
+    )
+    leaders = {label: (player, value) for label, player, value in build_highlights(store, HIGHLIGHTS['receiving'])[2024]}
+
+    assert leaders['Most 1D'] == ('Tyreek Hill', '70')
+    assert leaders['Most Yards'] == ('Tyreek Hill', '1600')
+    # Rookie has the best 1D per Rec (0.50) but is below 40 receptions.
+    assert leaders['Highest 1D per Rec (40+ Rec)'] == ('Tyreek Hill', '0.64')
+
+
+def test_missing_columns_drop_only_their_leaders():
+    store = _receiving(Rec=pd.array([60, 90, 50, 10], dtype='Int64'))
+    labels = [label for label, _, _ in build_highlights(store, HIGHLIGHTS['receiving'])[2024]]
+    assert labels == ['Most 1D', 'Most Receptions', 'Highest 1D per Rec (40+ Rec)']
+
+    assert [label for label, _, _ in build_highlights(_receiving(), HIGHLIGHTS['receiving'])[2024]] == ['Most 1D']
@@ -0,0 +1,38 @@
+import pandas as pd
+
+from utils.leaderboard import build_leaderboards, rank_of, top_n
+from utils.store import build_store, season_frame
+
+
+def _teams(order):
+    rows = pd.DataFrame({
+        'TEAM': ['KC', 'BUF', 'NYJ'],
+        'TOTAL': pd.array([300, 200, 100], dtype='Int64'),
+        'RUSH': pd.array([100, 80, 40], dtype='Int64'),
+        'PASS': pd.array([180, 110, 50], dtype='Int64'),
+        'PEN': pd.array([20, 10, 10], dtype='Int64'),
+    })
+    return build_store('teams', {'2024': rows.iloc[order].reset_index(drop=True)})
+
+
+def test_resorted_sheet_gets_a_new_version():
+    assert _teams([0, 1, 2]).attrs['version'] != _teams([2, 1, 0]).attrs['version']
+    assert _teams([0, 1, 2]).attrs['version'] == _teams([0, 1, 2]).attrs['version']
+
+
+def test_positions_refer_to_the_season_frame_rows():
+    for order in ([0, 1, 2], [2, 1, 0], [1, 2, 0]):
+        store = _teams(order)
+        board = build_leaderboards(store, ['TOTAL', 'PEN', 'MISSING'])[2024]
+        df = season_frame(store, 2024)
+
+        assert top_n(df, board, 'TOTAL')['TEAM'].tolist() == ['KC', 'BUF', 'NYJ']
+        assert rank_of(df, board, 'TOTAL', 'TEAM', 'NYJ') == 3
+        assert rank_of(df, board, 'TOTAL', 'TEAM', 'LV') is None
+        assert 'MISSING' not in board['order']
+
+
+def test_ties_keep_sheet_order():
+    store = _teams([0, 2, 1])
+    board = build_leaderboards(store, ['PEN'])[2024]
+    assert top_n(season_frame(store, 2024), board, 'PEN')['TEAM'].tolist() == ['KC', 'NYJ', 'BUF']
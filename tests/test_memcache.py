@@ -0,0 +1,86 @@
+import types
+
+import numpy as np
+import pytest
+
+from utils import memcache
+from utils.memcache import BoundedCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = types.SimpleNamespace(value=1000.0)
+    monkeypatch.setattr(memcache, 'time', types.SimpleNamespace(time=lambda: now.value))
+    return now
+
+
+def _blob(n):
+    return np.zeros(n, dtype=np.uint8)
+
+
+def test_evicts_least_recently_used_over_the_byte_budget():
+    cache = BoundedCache(max_bytes=250)
+    cache.put(('t', 'a'), _blob(100))
+    cache.put(('t', 'b'), _blob(100))
+    assert cache.get(('t', 'a')) is not None  # 'b' is now least recently used
+    cache.put(('t', 'c'), _blob(100))
+
+    assert cache.get(('t', 'b')) is None
+    assert cache.get(('t', 'a')) is not None
+    assert cache.get(('t', 'c')) is not None
+    assert cache.total_bytes == 200
+    assert cache.stats['t']['evictions'] == 1
+
+
+def test_oversized_entry_is_kept_until_the_next_insert():
+    cache = BoundedCache(max_bytes=50)
+    cache.put(('t', 'big'), _blob(100))
+    assert cache.get(('t', 'big')) is not None
+    cache.put(('t', 'small'), _blob(10))
+    assert cache.get(('t', 'big')) is None
+    assert cache.total_bytes == 10
+
+
+def test_entries_expire_after_their_ttl(clock):
+    cache = BoundedCache()
+    cache.put(('t', 'a'), _blob(10), ttl=60)
+    clock.value += 59
+    assert cache.get(('t', 'a')) is not None
+    clock.value += 1
+    assert cache.get(('t', 'a')) is None
+    assert cache.total_bytes == 0
+    assert cache.stats['t']['expirations'] == 1
+
+
+def test_get_or_compute_counts_hits_and_misses():
+    cache, calls = BoundedCache(), []
+
+    def build():
+        calls.append(1)
+        return _blob(10)
+
+    first = cache.get_or_compute(('t', 'a'), build)
+    assert cache.get_or_compute(('t', 'a'), build) is first
+    assert len(calls) == 1
+    assert cache.stats['t'] == {'hits': 1, 'misses': 1, 'evictions': 0, 'expirations': 0}
+
+
+def test_sizer_sets_the_charged_bytes():
+    cache = BoundedCache()
+    cache.put(('t', 'a'), object(), sizer=lambda value: 1234)
+    assert cache.total_bytes == 1234
+
+
+def test_cached_leaves_underscore_arguments_out_of_the_key(monkeypatch):
+    monkeypatch.setattr(memcache, 'CACHE', BoundedCache())
+    calls = []
+
+    @memcache.cached(name='double')
+    def double(_frame, version):
+        calls.append(version)
+        return _frame * 2
+
+    assert double(2, 'v1') == 4
+    assert double(3, 'v1') == 4  # same key: the frame argument is not hashed
+    assert double(3, 'v2') == 6
+    assert calls == ['v1', 'v2']
@@ -0,0 +1,50 @@
+import pandas as pd
+
+from utils.players import build_player_tables, player_career
+from utils.store import build_store
+
+
+def _store(family, seasons, team=True):
+    frames = {}
+    for season, rows in seasons.items():
+        frame = pd.DataFrame({'Player': [p for p, _, _ in rows], '1D': pd.array([d for _, _, d in rows], dtype='Int64')})
+        if family == 'rushing':
+            frame = frame.assign(Att=pd.array([10] * len(rows), dtype='Int64'), Yds=50.0)
+            frame['Rushing First Down Rate'] = 40.0
+        if team:
+            frame['Team'] = [t for _, t, _ in rows]
+        frames[season] = frame
+    return build_store(family, frames)
+
+
+def _stores(extra=()):
+    return {
+        'passing': _store('passing', {'2023': [('Josh Allen', 'BUF', 200)], '2024': [('Josh Allen', 'BUF', 190)]}),
+        'rushing': _store('rushing', {
+            '2023': [('Josh Allen', 'BUF', 40), ('Derrick Henry', 'TEN', 60)],
+            '2024': [('Derrick Henry', 'BAL', 90), *extra],
+        }),
+        'receiving': _store('receiving', {'2024': [('Travis Kelce', None, 50)]}, team=False),
+    }
+
+
+def test_dim_and_careers():
+    dim, ids, careers = build_player_tables(_stores())
+
+    henry = dim.loc[ids['Derrick Henry']]
+    assert (henry['First Season'], henry['Last Season'], henry['Seasons']) == (2023, 2024, 2)
+    assert henry['Teams'] == "TEN 2023, BAL 2024"
+    assert dim.loc[ids['Travis Kelce'], 'Teams'] == ""
+    assert dim['Player'].tolist() == sorted(dim['Player'])
+
+    allen = player_career(careers, ids['Josh Allen'])
+    assert allen.loc[2023].tolist() == [200, 40, 0]
+    assert allen.loc[2024].tolist() == [190, 0, 0]
+
+
+def test_ids_survive_a_new_player():
+    _, before, _ = build_player_tables(_stores())
+    _, after, _ = build_player_tables(_stores(extra=[('Aaron Jones', 'MIN', 30)]))
+
+    assert len(after) == len(before) + 1
+    assert after[before.index].equals(before)
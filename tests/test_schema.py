@@ -0,0 +1,30 @@
+import pandas as pd
+
+from utils.schema import parse_csv, schema_fingerprint
+
+RECEIVING = b" Player,Team ,Rec,Yds,TD,1D\nTyreek Hill,MIA,81,959,6,45\nRookie,KAN,,,,3\n"
+RUSHING = b"Player,Att,Yds,TD,1D,Explosiveness,Rushing First Down Rate\nA,10,50,1,4,1.5,40.0%\nB,5,x,0,1,,\n"
+
+
+def test_declared_columns_keep_their_dtypes_with_blank_cells():
+    df = parse_csv(RECEIVING, 'receiving')
+
+    assert list(df.columns) == ['Player', 'Team', 'Rec', 'Yds', 'TD', '1D']
+    for col in ['Rec', 'Yds', 'TD', '1D']:
+        assert df[col].dtype == 'Int64', col
+    assert df['Rec'].isna().tolist() == [False, True]
+
+
+def test_percentages_and_stray_cells():
+    df = parse_csv(RUSHING, 'rushing')
+
+    assert df['Rushing First Down Rate'].dtype == 'float64'
+    assert df['Rushing First Down Rate'].iloc[0] == 40.0
+    # A non-numeric cell becomes NA instead of turning the column into strings.
+    assert df['Yds'].dtype == 'Int64'
+    assert pd.isna(df['Yds'].iloc[1])
+
+
+def test_fingerprint_is_per_schema():
+    assert schema_fingerprint('receiving') != schema_fingerprint('rushing')
+    assert schema_fingerprint('receiving') == schema_fingerprint('receiving')
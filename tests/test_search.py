@@ -0,0 +1,26 @@
+import pandas as pd
+
+from utils.search import PlayerIndex
+
+NAMES = ['Patrick Mahomes', 'Jayden Daniels', 'Saquon Barkley', 'Player 012', 'Player 120']
+
+
+def _index():
+    store = pd.DataFrame(
+        {'1D': range(len(NAMES))},
+        index=pd.MultiIndex.from_product([[2024], NAMES], names=['Season', 'Player']),
+    )
+    return PlayerIndex({'rushing': store})
+
+
+def test_short_queries_match_substrings_with_word_starts_first():
+    index = _index()
+    assert index.matching_names("ay") == {'Jayden Daniels', 'Player 012', 'Player 120'}
+    assert index.matching_names("12") == {'Player 012', 'Player 120'}
+    assert [hit['name'] for hit in index.search("12", fuzzy=False)] == ['Player 120', 'Player 012']
+
+
+def test_longer_queries_match_substrings():
+    index = _index()
+    assert index.matching_names("arkl") == {'Saquon Barkley'}
+    assert index.matching_names("MAHOMES") == {'Patrick Mahomes'}
@@ -0,0 +1,74 @@
+import sys
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from utils import shared
+from utils.store import build_store, season_frame
+
+
+def _season(players, att):
+    return pd.DataFrame({
+        'Player': players,
+        'Team': ['KAN', 'BUF', 'KAN'][:len(players)],
+        'Att': pd.array(att, dtype='Int16'),
+        'Rate': np.linspace(80.0, 100.0, len(players)),
+    })
+
+
+@pytest.fixture
+def store():
+    return build_store('passing', {
+        '2023': _season(['Patrick Mahomes', 'Josh Allen', 'Blaine Gabbert'], [597, 579, None]),
+        '2024': _season(['Patrick Mahomes', 'Josh Allen'], [581, 483]),
+    })
+
+
+def _mapped_ranges(path):
+    """Address ranges of ``path``'s mappings in this process, from /proc/self/maps."""
+    ranges = []
+    with open("/proc/self/maps") as maps:
+        for line in maps:
+            fields = line.split()
+            if len(fields) >= 6 and fields[5] == str(path):
+                lo, hi = (int(x, 16) for x in fields[0].split("-"))
+                ranges.append((lo, hi))
+    return ranges
+
+
+def _buffers(series):
+    values = pa.array(series.array)
+    for chunk in getattr(values, 'chunks', [values]):
+        parts = [chunk, chunk.dictionary] if pa.types.is_dictionary(chunk.type) else [chunk]
+        for part in parts:
+            yield from (buf for buf in part.buffers() if buf is not None and buf.size)
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="reads /proc/self/maps")
+def test_attach_keeps_columns_on_the_map(store, tmp_path):
+    generation = shared.publish({'passing': store}, tmp_path)
+    attached = shared.attach('passing', generation, tmp_path)
+
+    ranges = _mapped_ranges(tmp_path / generation / "passing.arrow")
+    assert ranges
+    for col in attached.columns:
+        assert isinstance(attached[col].dtype, pd.ArrowDtype), col
+        for buf in _buffers(attached[col]):
+            assert any(lo <= buf.address and buf.address + buf.size <= hi for lo, hi in ranges), col
+
+
+def test_attached_slices_match_the_built_store(store, tmp_path):
+    generation = shared.publish({'passing': store}, tmp_path)
+    attached = shared.attach('passing', generation, tmp_path)
+
+    assert attached.attrs['version'] == store.attrs['version']
+    assert list(attached.index.names) == ['Season', 'Player']
+    for season in (2023, 2024):
+        pd.testing.assert_frame_equal(season_frame(attached, season), season_frame(store, season))
+
+
+def test_to_native_leaves_numpy_frames_alone(store):
+    frame = season_frame(store, 2024)
+    assert shared.to_native(frame) is frame
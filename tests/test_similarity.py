@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+
+from utils.similarity import build_similarity, distance_matrix, most_similar
+from utils.store import build_store
+
+
+def _teams(rows):
+    frame = pd.DataFrame(rows, columns=['TEAM', 'TOTAL', 'PASS', 'RUSH', 'PEN'])
+    for col in ['TOTAL', 'PASS', 'RUSH', 'PEN']:
+        frame[col] = frame[col].astype('Int64')
+    return frame
+
+
+def _store():
+    return build_store('teams', {
+        '2023': _teams([('KC', 300, 180, 100, 20), ('BUF', 280, 170, 95, 15), ('NYJ', 200, 100, 80, 20)]),
+        '2024': _teams([('KC', 301, 181, 100, 20), ('BUF', 210, 105, 85, 20), ('NYJ', 150, 70, 60, 20)]),
+    })
+
+
+def test_distances_are_symmetric_with_a_zero_diagonal():
+    sim = build_similarity(_store())
+    assert np.allclose(sim['distance'], sim['distance'].T)
+    assert np.allclose(np.diag(sim['distance']), 0)
+
+
+def test_most_similar_excludes_itself_and_sorts_by_distance():
+    sim = build_similarity(_store())
+    matches = most_similar(sim, 'KC', 2024, k=3)
+
+    assert matches[0][:2] == ('KC', 2023)
+    assert ('KC', 2024) not in [(team, season) for team, season, _ in matches]
+    assert [d for _, _, d in matches] == sorted(d for _, _, d in matches)
+
+
+def test_distance_matrix_follows_the_requested_order():
+    sim = build_similarity(_store())
+    full = distance_matrix(sim, ['KC', 'BUF', 'NYJ'], 2024)
+    swapped = distance_matrix(sim, ['NYJ', 'KC'], 2024)
+    assert swapped[0, 1] == full[2, 0]
+    assert swapped.shape == (2, 2)
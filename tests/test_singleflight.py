@@ -0,0 +1,77 @@
+import threading
+import time
+
+import pytest
+
+from utils.singleflight import SingleFlight
+
+WAITERS = 8
+
+
+def _run_concurrently(flights, fn):
+    """Start a leader and ``WAITERS`` callers on one key; returns results and errors."""
+    results, errors = [], []
+
+    def call():
+        try:
+            results.append(flights.do('key', fn))
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=call) for _ in range(WAITERS + 1)]
+    for thread in threads:
+        thread.start()
+    return threads, results, errors
+
+
+def test_leader_runs_once_and_waiters_share_the_result():
+    flights, release, calls = SingleFlight(), threading.Event(), []
+
+    def fetch():
+        calls.append(1)
+        release.wait()
+        return object()
+
+    threads, results, errors = _run_concurrently(flights, fetch)
+    time.sleep(0.2)  # let every caller join the flight
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert not errors
+    assert len(results) == WAITERS + 1
+    assert all(result is results[0] for result in results)
+
+
+def test_error_reaches_every_waiter():
+    flights, release = SingleFlight(), threading.Event()
+    boom = RuntimeError("sheet unreachable")
+
+    def fetch():
+        release.wait()
+        raise boom
+
+    threads, results, errors = _run_concurrently(flights, fetch)
+    time.sleep(0.2)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert not results
+    assert len(errors) == WAITERS + 1
+    assert all(error is boom for error in errors)
+
+
+def test_key_is_free_again_after_the_call():
+    flights, calls = SingleFlight(), []
+
+    def fetch():
+        calls.append(1)
+        return len(calls)
+
+    assert flights.do('key', fetch) == 1
+    assert flights.do('key', fetch) == 2
+    with pytest.raises(ZeroDivisionError):
+        flights.do('key', lambda: 1 / 0)
+    assert flights.do('key', fetch) == 3
@@ -0,0 +1,22 @@
+"""Data loading, caching and rendering helpers shared by the pages.
+
+Streamlit leaves the root logger at WARNING with no handler, so the
+``utils.*`` loggers (store refreshes, prewarm, shared publishing, disk cache
+fallbacks) get their own stderr handler here, as ``utils.timing`` does for
+its timing log.
+
+Configuration:
+    FIRSTDOWN_LOG_LEVEL  level for the ``utils`` loggers (default INFO)
+"""
+
+import logging
+import os
+import sys
+
+_logger = logging.getLogger(__name__)
+if not _logger.handlers:
+    _handler = logging.StreamHandler(sys.stderr)
+    _handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    _logger.addHandler(_handler)
+    _logger.setLevel(os.environ.get("FIRSTDOWN_LOG_LEVEL", "INFO").upper())
+    _logger.propagate = False
@@ -0,0 +1,107 @@
+"""Top-N leaderboard cards rendered as a single HTML payload.
+
+The pages used to loop over ``iterrows()`` and call ``st.markdown`` once per
+card with the full inline style repeated on every card.  These helpers
+build the whole strip from column vectors and send it in one message, with
+the shared styles defined once by class.
+
+Streamlit removes any element that is not re-emitted on a rerun, so the
+stylesheet travels inside the strip's payload rather than as a separate
+one-off element; it is a single short ``<style>`` block either way.
+"""
+
+import html
+
+import numpy as np
+import streamlit as st
+
+MEDALS = ["🥇", "🥈", "🥉"]
+ORDINALS = ["1st 🥇", "2nd 🥈", "3rd 🥉", "4th", "5th"]
+
+# Backgrounds shared by the rushing and receiving strips.
+PASTEL_GRADIENTS = [
+    "linear-gradient(135deg, #E3F2FD, #BBDEFB)",
+    "linear-gradient(135deg, #E8F5E9, #A5D6A7)",
+    "linear-gradient(135deg, #FFF3E0, #FFCC80)",
+    "linear-gradient(135deg, #F3E5F5, #CE93D8)",
+    "linear-gradient(135deg, #ECEFF1, #B0BEC5)",
+]
+
+PODIUM_GRADIENTS = [
+    "linear-gradient(135deg, #FFD700, #FFC300)",   # Gold
+    "linear-gradient(135deg, #C0C0C0, #A9A9A9)",   # Silver
+    "linear-gradient(135deg, #CD7F32, #B87333)",   # Bronze
+]
+
+CARD_CSS = """<style>
+.fd-strip{display:grid;grid-template-columns:repeat(var(--fd-cols),minmax(0,1fr));gap:1rem;margin-bottom:1rem;}
+.fd-card{padding:10px 12px;border-radius:12px;box-shadow:0 3px 8px rgba(0,0,0,0.2);text-align:center;color:#222;font-weight:600;}
+.fd-card .fd-rank{margin:0 0 6px 0;font-size:16px;font-weight:700;color:#333;letter-spacing:1px;}
+.fd-card h4{margin:0 0 6px 0;padding:0;font-size:20px;font-weight:900;color:#111;text-transform:uppercase;}
+.fd-card .fd-value{font-size:18px;margin:4px 0;color:#0d47a1;font-weight:700;}
+.fd-card .fd-detail{font-size:13px;margin:2px 0;}
+.fd-card.podium h4{font-size:22px;text-shadow:1px 1px 2px rgba(255,255,255,0.7);letter-spacing:1.5px;}
+.fd-card.podium .fd-value{color:#111;}
+.fd-list-item{padding:0.3rem 0.6rem;border-radius:6px;margin-bottom:0.3rem;font-family:'Segoe UI',Tahoma,Geneva,Verdana,sans-serif;color:white;font-size:0.9rem;position:relative;overflow:hidden;}
+.fd-list-item.gold{background:linear-gradient(90deg,#FFD700,#FFC107);}
+.fd-list-item.silver{background:linear-gradient(90deg,#C0C0C0,#A9A9A9);}
+.fd-list-item.bronze{background:linear-gradient(90deg,#CD7F32,#B87333);}
+.fd-list-item.others{background:linear-gradient(90deg,#4a90e2,#357ABD);}
+.fd-list-item .fd-bar{position:absolute;left:0;top:0;bottom:0;z-index:0;opacity:0.3;border-radius:6px;background-color:rgba(74,144,226,0.7);}
+.fd-list-item.gold .fd-bar{background-color:rgba(255,215,0,0.7);}
+.fd-list-item.silver .fd-bar{background-color:rgba(192,192,192,0.7);}
+.fd-list-item.bronze .fd-bar{background-color:rgba(205,127,50,0.7);}
+.fd-list-item .fd-text{position:relative;z-index:1;width:100%;display:flex;justify-content:space-between;align-items:center;}
+</style>"""
+
+
+def _text(values):
+    return [html.escape(str(v)) for v in values]
+
+
+def _counts(series):
+    """Integer display strings for a count column (nullable ints included)."""
+    return series.astype('Int64').astype(str).tolist()
+
+
+def render_card_strip(names, values, value_label, gradients, ranks=None, details=None, podium=False):
+    """One row of cards, one per entry of ``names``, sent as a single element.
+
+    ``names``/``values``/``details`` are equal-length Series; ``values`` is
+    shown as ``"<value> <value_label>"``.
+    """
+    names, values = _text(names), _counts(values)
+    ranks = ranks or [""] * len(names)
+    details = _text(details) if details is not None else [""] * len(names)
+    card_class = "fd-card podium" if podium else "fd-card"
+
+    cards = "".join(
+        f'<div class="{card_class}" style="background:{gradient};">'
+        + (f'<p class="fd-rank">{rank}</p>' if rank else "")
+        + f'<h4>{name}</h4><p class="fd-value">{value} {value_label}</p>'
+        + (f'<p class="fd-detail">{detail}</p>' if detail else "")
+        + '</div>'
+        for name, value, gradient, rank, detail in zip(names, values, gradients, ranks, details)
+    )
+    st.markdown(
+        f'{CARD_CSS}<div class="fd-strip" style="--fd-cols:{len(names)};">{cards}</div>',
+        unsafe_allow_html=True,
+    )
+
+
+def render_rank_list(names, values, value_label):
+    """Stacked medal list with a bar scaled to each value, as a single element."""
+    numeric = values.to_numpy(dtype='float64', na_value=0.0)
+    peak = numeric.max() if len(numeric) and numeric.max() > 0 else 1.0
+    # Bar width as a percentage of the leader, with a minimum for visibility
+    widths = np.maximum(10, numeric / peak * 100)
+    tiers = ["gold", "silver", "bronze"] + ["others"] * max(0, len(numeric) - 3)
+    medals = MEDALS + [f"{i + 1}." for i in range(3, len(numeric))]
+
+    items = "".join(
+        f'<div class="fd-list-item {tier}"><div class="fd-bar" style="width:{width:.1f}%;"></div>'
+        f'<div class="fd-text"><span><strong>{medal} {name}</strong></span>'
+        f'<span>{value_label}: <strong>{value}</strong></span></div></div>'
+        for name, value, width, tier, medal in zip(_text(names), _counts(values), widths, tiers, medals)
+    )
+    st.markdown(CARD_CSS + items, unsafe_allow_html=True)
@@ -0,0 +1,159 @@
+"""On-disk cache for the published CSV sheets.
+
+Each fetched URL is stored as a Feather file next to a small JSON sidecar
+holding the ETag, Last-Modified and a SHA-256 of the raw CSV body.  Reads
+revalidate with a conditional GET; when the sheet is unchanged (304 or an
+identical body) or unreachable, the frame is served straight from disk.
+
+Concurrent reads of the same sheet are coalesced: one thread fetches and
+parses, the others wait for and share its frame.
+"""
+
+import hashlib
+import io
+import json
+import logging
+import os
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import pandas as pd
+
+from utils.schema import parse_csv, schema_fingerprint
+from utils.singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = Path(os.environ.get(
+    "FIRSTDOWN_CACHE_DIR",
+    Path(__file__).resolve().parent.parent / ".cache" / "datasets",
+))
+
+# Seconds a disk copy is trusted before it is revalidated against the sheet.
+MAX_AGE = int(os.environ.get("FIRSTDOWN_CACHE_MAX_AGE", 300))
+TIMEOUT = 10
+
+_flights = SingleFlight()
+
+
+def _paths(url, schema=None):
+    key = hashlib.sha1(f"{schema or ''}|{url}".encode()).hexdigest()[:16]
+    return CACHE_DIR / f"{key}.feather", CACHE_DIR / f"{key}.json"
+
+
+def _read_meta(meta_path):
+    try:
+        return json.loads(meta_path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_atomic(path, write):
+    """Write ``path`` through ``write(tmp_path)`` and rename it into place.
+
+    Each writer gets its own temp file: several server processes can share
+    the cache directory and revalidate the same sheet at the same moment.
+    """
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    os.close(fd)
+    tmp = Path(tmp)
+    try:
+        write(tmp)
+        os.chmod(tmp, 0o644)  # mkstemp creates 0600; other processes read these
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _download(url, headers):
+    """Return ``(status, headers, body)``; a 304 comes back with an empty body."""
+    request = urllib.request.Request(url, headers=headers)
+    try:
+        with urllib.request.urlopen(request, timeout=TIMEOUT) as resp:
+            return resp.status, resp.headers, resp.read()
+    except urllib.error.HTTPError as exc:
+        if exc.code == 304:
+            return 304, exc.headers, b""
+        raise
+
+
+def _parse(body, schema):
+    if schema is None:
+        return pd.read_csv(io.BytesIO(body))
+    return parse_csv(body, schema)
+
+
+def read_csv_cached(url, max_age=MAX_AGE, schema=None):
+    """Drop-in for ``pd.read_csv(url)`` backed by the on-disk cache.
+
+    Pass ``max_age=float('inf')`` for sheets that never change: once on disk
+    they are served without any network request.
+
+    With ``schema`` set to a key of ``utils.schema.SCHEMAS`` the body is
+    parsed with that schema's dtypes, and the Feather copy is stored already
+    typed so disk hits skip parsing entirely.
+
+    Callers that arrive while the same ``(url, schema)`` is being read get
+    that read's frame (shared, so copy before mutating).
+    """
+    return _flights.do((url, schema), _read_csv_cached, url, max_age, schema)
+
+
+def _read_csv_cached(url, max_age, schema):
+    data_path, meta_path = _paths(url, schema)
+    meta = _read_meta(meta_path)
+    fingerprint = schema_fingerprint(schema) if schema else None
+    if meta.get("schema") != fingerprint:
+        meta = {}
+    on_disk = data_path.exists() and bool(meta)
+
+    if on_disk and time.time() - meta.get("checked_at", 0) < max_age:
+        return pd.read_feather(data_path)
+
+    headers = {}
+    if on_disk:
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    try:
+        status, resp_headers, body = _download(url, headers)
+    except (urllib.error.URLError, OSError) as exc:
+        if on_disk:
+            logger.warning("Serving %s from disk, source unreachable: %s", url, exc)
+            return pd.read_feather(data_path)
+        raise
+
+    digest = hashlib.sha256(body).hexdigest() if body else meta.get("sha256")
+    unchanged = on_disk and (status == 304 or digest == meta.get("sha256"))
+
+    meta.update(
+        url=url,
+        etag=resp_headers.get("ETag") or meta.get("etag"),
+        last_modified=resp_headers.get("Last-Modified") or meta.get("last_modified"),
+        sha256=digest,
+        schema=fingerprint,
+        checked_at=time.time(),
+    )
+
+    if unchanged:
+        df = pd.read_feather(data_path)
+    else:
+        df = _parse(body, schema)
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            _write_atomic(data_path, df.to_feather)
+        except (OSError, ValueError) as exc:
+            logger.warning("Could not cache %s on disk: %s", url, exc)
+            return df
+
+    try:
+        _write_atomic(meta_path, lambda p: p.write_text(json.dumps(meta)))
+    except OSError as exc:
+        logger.warning("Could not write cache metadata for %s: %s", url, exc)
+    return df
@@ -0,0 +1,120 @@
+"""Per-season "Year Highlights", precomputed once per store build.
+
+Each family declares how its player rows are aggregated (a player can
+appear more than once in a season) and which leaders to report.  For every
+season the aggregated metrics form one matrix; rows below a highlight's
+qualifying threshold are masked out and a single ``argmax`` over the matrix
+picks every leader at once.
+"""
+
+import html
+
+import numpy as np
+import streamlit as st
+
+from utils.memcache import cached
+from utils.store import load_store
+
+# 'leaders' rows: label, metric, display format, qualifying (column, minimum) or None
+HIGHLIGHTS = {
+    'passing': {
+        'sum': ['1D', 'Yds', 'TD', 'Att'],
+        'mean': ['First Down Rate', 'QBR'],
+        'ratios': {},
+        'leaders': [
+            ('Most 1D', '1D', "{:.0f}", None),
+            ('Highest 1D Rate (200+ Att)', 'First Down Rate', "{:.1f}%", ('Att', 200)),
+            ('Most Yards', 'Yds', "{:.0f}", None),
+            ('Most TD', 'TD', "{:.0f}", None),
+            ('Highest QBR (200+ Att)', 'QBR', "{:.1f}", ('Att', 200)),
+        ],
+    },
+    'rushing': {
+        'sum': ['1D', 'Att', 'Yds'],
+        'mean': ['Rushing First Down Rate', 'Explosiveness'],
+        'ratios': {'YPC': ('Yds', 'Att')},
+        'leaders': [
+            ('Most 1D', '1D', "{:.0f}", None),
+            ('Highest 1D Rate', 'Rushing First Down Rate', "{:.2f}%", None),
+            ('Highest Explosiveness', 'Explosiveness', "{:.2f}", None),
+            ('Most Attempts', 'Att', "{:.0f}", None),
+            ('Most Yards', 'Yds', "{:.0f}", None),
+            ('Highest YPC (100+ Att)', 'YPC', "{:.2f}", ('Att', 100)),
+        ],
+    },
+    'receiving': {
+        'sum': ['1D', 'Rec', 'Yds', 'TD'],
+        'mean': [],
+        'ratios': {'1D per Rec': ('1D', 'Rec')},
+        'leaders': [
+            ('Most 1D', '1D', "{:.0f}", None),
+            ('Most Receptions', 'Rec', "{:.0f}", None),
+            ('Most Yards', 'Yds', "{:.0f}", None),
+            ('Most TD', 'TD', "{:.0f}", None),
+            ('Highest 1D per Rec (40+ Rec)', '1D per Rec', "{:.2f}", ('Rec', 40)),
+        ],
+    },
+}
+
+
+def build_highlights(store, spec):
+    """``{season: [(label, player, formatted value)]}`` for every season of ``store``."""
+    # A sheet without a declared column loses only the leaders that need it.
+    present = set(store.columns)
+    aggs = {col: 'sum' for col in spec['sum'] if col in present}
+    aggs |= {col: 'mean' for col in spec['mean'] if col in present}
+    if not aggs:
+        return {}
+    grouped = store[list(aggs)].astype('float64').fillna(0).groupby(level=['Season', 'Player']).agg(aggs)
+    for name, (num, den) in spec['ratios'].items():
+        if num in grouped and den in grouped:
+            grouped[name] = grouped[num] / grouped[den].where(grouped[den] > 0)
+
+    leaders = [
+        leader for leader in spec['leaders']
+        if leader[1] in grouped and (leader[3] is None or leader[3][0] in grouped)
+    ]
+    if not leaders:
+        return {}
+    metrics = [metric for _, metric, _, _ in leaders]
+    highlights = {}
+    for season, rows in grouped.groupby(level='Season', sort=True):
+        values = rows[metrics].to_numpy(dtype='float64', na_value=np.nan)
+        for j, (_, _, _, qualify) in enumerate(leaders):
+            if qualify:
+                column, minimum = qualify
+                values[rows[column].to_numpy() < minimum, j] = np.nan
+        values = np.where(np.isnan(values), -np.inf, values)
+        best = values.argmax(axis=0)
+
+        players = rows.index.get_level_values('Player')
+        highlights[int(season)] = [
+            (label, players[i], fmt.format(values[i, j]))
+            for j, ((label, _, fmt, _), i) in enumerate(zip(leaders, best))
+            if np.isfinite(values[i, j])
+        ]
+    return highlights
+
+
+@cached(name='highlights')
+def _cached_highlights(_store, family, version):
+    return build_highlights(_store, HIGHLIGHTS[family])
+
+
+def get_highlights(family, season):
+    """Highlights for one season, built once per version of the family store."""
+    store = load_store(family)
+    return _cached_highlights(store, family, store.attrs.get('version')).get(int(season), [])
+
+
+def render_highlights(items):
+    """Compact bullet list of ``(label, player, value)`` as a single element."""
+    rows = "".join(
+        f"<li><b>{html.escape(label)}:</b> {html.escape(str(player))} ({value})</li>"
+        for label, player, value in items
+    )
+    st.markdown(
+        '<ul style="font-size: 14px; line-height: 1.3; padding-left: 1.2em; margin-top: 0; margin-bottom: 0;">'
+        f"{rows}</ul>",
+        unsafe_allow_html=True,
+    )
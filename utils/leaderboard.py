@@ -0,0 +1,73 @@
+"""Per-season leaderboards precomputed once per store build.
+
+For every ranked metric of every season the row order (best first) and the
+rank of each row are stored as NumPy arrays, so top-N widgets take an
+``iloc`` slice instead of re-sorting the frame on every rerun.  Positions
+refer to the rows of ``season_frame(store, season)`` for the same store, so
+pages take both from one ``load_store`` call via ``get_ranked_season``.
+"""
+
+import numpy as np
+
+from utils.memcache import cached
+from utils.store import load_store, season_frame
+
+RANKED = {
+    'passing': ['1D', 'Yds', 'TD', 'Cmp', 'Att', 'Rate', 'QBR', 'First Down Rate'],
+    'rushing': ['1D', 'Yds', 'Att', 'TD', 'YPC', 'Rushing First Down Rate', 'Explosiveness'],
+    'receiving': ['1D', 'Yds', 'TD', 'Rec'],
+    'teams': ['TOTAL', 'PASS', 'RUSH', 'PEN'],
+}
+
+
+def build_leaderboards(store, metrics):
+    """``{season: {'order': {metric: positions}, 'rank': {metric: ranks}}}``."""
+    boards = {}
+    for season, rows in store.groupby(level='Season', sort=True):
+        order, rank = {}, {}
+        for metric in metrics:
+            if metric not in rows.columns:
+                continue
+            values = rows[metric].to_numpy(dtype='float64', na_value=np.nan)
+            # Stable descending sort; NaNs end up last.
+            order[metric] = np.argsort(-values, kind='stable')
+            rank[metric] = np.empty(len(values), dtype=np.int32)
+            rank[metric][order[metric]] = np.arange(1, len(values) + 1)
+        boards[int(season)] = {'order': order, 'rank': rank}
+    return boards
+
+
+@cached(name='leaderboards')
+def _cached_leaderboards(_store, family, version):
+    return build_leaderboards(_store, RANKED[family])
+
+
+def get_leaderboard(family, season, store=None):
+    """Leaderboard for one season, built once per version of the family store.
+
+    Pass the ``store`` the season frame came from; the refresher may swap in
+    a new one between two ``load_store`` calls.
+    """
+    if store is None:
+        store = load_store(family)
+    boards = _cached_leaderboards(store, family, store.attrs.get('version'))
+    return boards[int(season)]
+
+
+def get_ranked_season(family, season):
+    """``(season_frame, leaderboard)`` for one season, both from the same store."""
+    store = load_store(family)
+    return season_frame(store, season), get_leaderboard(family, season, store)
+
+
+def top_n(df, board, metric, n=None):
+    """The ``n`` best rows of ``df`` by ``metric`` (all rows when ``n`` is None)."""
+    return df.iloc[board['order'][metric][:n]]
+
+
+def rank_of(df, board, metric, column, value):
+    """1-based rank of the first row where ``df[column] == value``, or None."""
+    hits = np.flatnonzero((df[column] == value).to_numpy())
+    if not len(hits):
+        return None
+    return int(board['rank'][metric][hits[0]])
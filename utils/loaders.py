@@ -0,0 +1,19 @@
+"""Helpers for loading several seasons of a sheet at once."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.disk_cache import read_csv_cached
+
+
+def load_seasons(urls, loader=read_csv_cached, max_workers=None):
+    """Fetch every ``{season: url}`` concurrently and return ``{season: df}``.
+
+    The fetches are network bound, so a thread pool brings the total wait
+    down to roughly the slowest single season instead of the sum of all.
+    """
+    if not urls:
+        return {}
+    seasons = list(urls)
+    with ThreadPoolExecutor(max_workers=max_workers or len(seasons)) as pool:
+        frames = pool.map(loader, (urls[season] for season in seasons))
+        return dict(zip(seasons, frames))
@@ -0,0 +1,184 @@
+"""Byte-bounded in-process cache for frames and derived data.
+
+    @cached()
+    def _cached_leaderboards(_store, family, version):
+        ...
+
+Unlike ``st.cache_data`` (unbounded here, and a pickled copy per hit) this
+returns the cached object itself, so results must be treated as read-only.
+Every entry is sized when stored: DataFrames and Series with
+``memory_usage(deep=True)``, NumPy arrays by ``nbytes``, containers
+recursively.  When the total exceeds ``MAX_BYTES`` the least recently used
+entries are evicted; entries older than their TTL are dropped on access.
+Objects this can't see into declare their size with ``__sizeof__`` or are
+cached with ``cached(sizer=...)``.  Arguments whose name starts with ``_``
+are left out of the key, as with Streamlit's caches, and concurrent misses
+for one key run the function once.
+
+``cache_report()`` lists entries, sizes, hits, misses and evictions; the
+``cache_admin`` page shows it.
+
+Configuration:
+    FIRSTDOWN_CACHE_MAX_BYTES  byte budget for all entries (default 512 MiB)
+    FIRSTDOWN_CACHE_TTL        default entry TTL in seconds (default: none)
+"""
+
+import functools
+import inspect
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from utils.singleflight import SingleFlight
+
+MAX_BYTES = int(os.environ.get("FIRSTDOWN_CACHE_MAX_BYTES", 512 * 2**20))
+DEFAULT_TTL = float(os.environ["FIRSTDOWN_CACHE_TTL"]) if os.environ.get("FIRSTDOWN_CACHE_TTL") else None
+
+
+def sizeof(value):
+    """Approximate memory held by ``value`` in bytes."""
+    if isinstance(value, (pd.DataFrame, pd.Series, pd.Index)):
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum() if isinstance(usage, pd.Series) else usage)
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(sizeof(k) + sizeof(v) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(sizeof(v) for v in value)
+    return sys.getsizeof(value)
+
+
+class _Entry:
+    __slots__ = ('value', 'size', 'created', 'expires', 'hits')
+
+    def __init__(self, value, size, ttl):
+        self.value = value
+        self.size = size
+        self.created = time.time()
+        self.expires = self.created + ttl if ttl else None
+        self.hits = 0
+
+
+class BoundedCache:
+    """LRU cache bounded by total bytes, with optional per-entry TTL."""
+
+    def __init__(self, max_bytes=MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._flights = SingleFlight()
+        self.stats = {}
+
+    def _stat(self, name):
+        return self.stats.setdefault(name, {'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0})
+
+    def _drop(self, key, reason):
+        entry = self._entries.pop(key)
+        self.total_bytes -= entry.size
+        self._stat(key[0])[reason] += 1
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires is not None and time.time() >= entry.expires:
+                self._drop(key, 'expirations')
+                entry = None
+            if entry is None:
+                self._stat(key[0])['misses'] += 1
+                return None
+            self._entries.move_to_end(key)
+            entry.hits += 1
+            self._stat(key[0])['hits'] += 1
+            return entry
+
+    def put(self, key, value, ttl=None, sizer=sizeof):
+        entry = _Entry(value, sizer(value), ttl)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key, 'evictions')
+            self._entries[key] = entry
+            self.total_bytes += entry.size
+            # Oldest first; an entry larger than the whole budget still stays
+            # until the next insert, so the caller always gets its value.
+            while self.total_bytes > self.max_bytes and len(self._entries) > 1:
+                self._drop(next(iter(self._entries)), 'evictions')
+        return value
+
+    def get_or_compute(self, key, fn, ttl=None, sizer=sizeof):
+        entry = self.get(key)
+        if entry is not None:
+            return entry.value
+
+        def compute():
+            # A flight that finished just before this one started already stored it.
+            with self._lock:
+                entry = self._entries.get(key)
+            if entry is not None and (entry.expires is None or time.time() < entry.expires):
+                return entry.value
+            return self.put(key, fn(), ttl, sizer)
+
+        return self._flights.do(key, compute)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+    def report(self):
+        """``(entries, stats)`` as lists of dicts, largest entries first."""
+        now = time.time()
+        with self._lock:
+            entries = [
+                {
+                    'cache': key[0],
+                    'key': ", ".join(map(str, key[1])),
+                    'bytes': entry.size,
+                    'hits': entry.hits,
+                    'age_s': round(now - entry.created, 1),
+                    'ttl_left_s': round(entry.expires - now, 1) if entry.expires else None,
+                }
+                for key, entry in self._entries.items()
+            ]
+            stats = [
+                {'cache': name, **counts,
+                 'entries': sum(1 for key in self._entries if key[0] == name),
+                 'bytes': sum(e.size for key, e in self._entries.items() if key[0] == name)}
+                for name, counts in self.stats.items()
+            ]
+        return sorted(entries, key=lambda e: -e['bytes']), stats
+
+
+CACHE = BoundedCache()
+
+
+def cached(ttl=DEFAULT_TTL, name=None, sizer=sizeof):
+    """Memoize a function in ``CACHE``; ``_``-prefixed arguments are not hashed.
+
+    ``sizer(result)`` gives the bytes charged against the budget.
+    """
+    def decorate(func):
+        signature = inspect.signature(func)
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = (label, tuple(v for k, v in bound.arguments.items() if not k.startswith('_')))
+            return CACHE.get_or_compute(key, lambda: func(*args, **kwargs), ttl, sizer)
+
+        return wrapper
+    return decorate
+
+
+def cache_report():
+    """Entries and per-cache counters of ``CACHE`` plus its budget."""
+    entries, stats = CACHE.report()
+    return {'max_bytes': CACHE.max_bytes, 'total_bytes': CACHE.total_bytes, 'entries': entries, 'stats': stats}
@@ -0,0 +1,112 @@
+"""Player dimension and career tables.
+
+Built once per version of the passing, rushing and receiving stores:
+
+``dim``     one row per player, indexed by an integer ``player_id``, with
+            first/last season, seasons played and team history (from the
+            ``Team`` column where a sheet has one);
+``ids``     ``Player`` name -> ``player_id``;
+``careers`` first downs per ``(player_id, Season)`` with one column per
+            position family, sorted so a player's career is one index slice.
+
+Pages resolve a name to its id once and then work on integer keys only.
+Ids are a hash of the name, so they survive rebuilds: a new live-season
+player does not renumber anyone else.
+"""
+
+import hashlib
+
+import pandas as pd
+
+from utils.memcache import cached
+from utils.store import load_store
+
+FAMILIES = ('passing', 'rushing', 'receiving')
+CAREER_COLUMNS = {family: f"{family.title()} 1D" for family in FAMILIES}
+
+
+def _team_history(rows):
+    """``"KC 2020–2022, LV 2023"`` from season-ordered (season, team) rows."""
+    spans = []
+    for season, team in rows:
+        if spans and spans[-1][0] == team and season - spans[-1][2] <= 1:
+            spans[-1][2] = season
+        else:
+            spans.append([team, season, season])
+    return ", ".join(
+        f"{team} {first}" if first == last else f"{team} {first}–{last}"
+        for team, first, last in spans
+    )
+
+
+def player_id(name):
+    """Integer id of a player name, the same in every build and every process."""
+    digest = hashlib.blake2b(name.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, 'big') >> 1  # non-negative int64
+
+
+def build_player_tables(stores):
+    """``(dim, ids, careers)`` for ``{family: store}``; see the module docstring."""
+    long = pd.concat(
+        [
+            # Team is optional: a sheet without it only loses the team history.
+            store.reindex(columns=['Team', '1D']).reset_index().assign(Family=family)
+            for family, store in stores.items()
+        ],
+        ignore_index=True,
+    )
+    long = long[long['Player'].notna()]
+    long['Team'] = long['Team'].astype('string').str.strip()
+
+    names = pd.Index(sorted(long['Player'].unique()), name='Player')
+    ids = pd.Series([player_id(name) for name in names], index=names, dtype='int64', name='player_id')
+    if ids.duplicated().any():
+        raise ValueError("player_id collision: " + ", ".join(ids.index[ids.duplicated(keep=False)]))
+    long['player_id'] = ids.reindex(long['Player']).to_numpy()
+
+    seasons = long.groupby('player_id')['Season']
+    history = (
+        long[['player_id', 'Season', 'Team']]
+        .dropna(subset=['Team'])
+        .drop_duplicates()
+        .sort_values(['player_id', 'Season', 'Team'])
+    )
+    teams = {pid: _team_history(zip(g['Season'], g['Team'])) for pid, g in history.groupby('player_id')}
+    dim = pd.DataFrame({
+        'Player': pd.Series(names, index=ids.to_numpy()),
+        'First Season': seasons.min(),
+        'Last Season': seasons.max(),
+        'Seasons': seasons.nunique(),
+        'Teams': pd.Series(teams, dtype=object),
+    }).reindex(ids.to_numpy())
+    dim['Teams'] = dim['Teams'].fillna("")
+    dim.index.name = 'player_id'
+
+    careers = (
+        long.pivot_table(index=['player_id', 'Season'], columns='Family', values='1D',
+                         aggfunc='sum', observed=True)
+        .reindex(columns=list(stores))
+        .rename(columns=CAREER_COLUMNS)
+        .fillna(0)
+        .astype('int32')
+        .sort_index()
+    )
+    careers.columns.name = None
+    return dim, ids, careers
+
+
+@cached(name='player_tables')
+def _cached_player_tables(_stores, versions):
+    return build_player_tables(_stores)
+
+
+def get_player_tables():
+    """Player tables for the current stores; rebuilt when a store changes."""
+    stores = {family: load_store(family) for family in FAMILIES}
+    versions = tuple(store.attrs.get('version') for store in stores.values())
+    return _cached_player_tables(stores, versions)
+
+
+def player_career(careers, player_id):
+    """One player's seasons, ``Season``-indexed."""
+    return careers.xs(player_id, level='player_id')
@@ -0,0 +1,70 @@
+"""Background prewarm started by the first script run in a server process.
+
+Streamlit has no server-start hook, so every entry script calls
+``start_prewarm()``; the first call in the process starts one daemon thread
+and later calls are a cache hit.  The thread imports the charting libraries
+and fills the store and derived caches for every family and season, so the
+first visitor to any page finds them warm instead of paying for imports and
+fetches.  Set ``FIRSTDOWN_PREWARM=off`` to disable it.
+"""
+
+import importlib
+import logging
+import os
+import threading
+import time
+
+import streamlit as st
+
+from utils.highlights import HIGHLIGHTS, get_highlights
+from utils.leaderboard import RANKED, get_leaderboard
+from utils.players import get_player_tables
+from utils.refresh import start_refresher
+from utils.search import get_player_index
+from utils.similarity import get_similarity
+from utils.sources import CSV_URLS
+from utils.teams import load_team_history
+
+logger = logging.getLogger(__name__)
+
+HEAVY_MODULES = ('plotly.express', 'plotly.graph_objects', 'altair')
+ENABLED = os.environ.get("FIRSTDOWN_PREWARM", "").lower() not in ("off", "0", "false")
+
+
+def _warm_caches():
+    for family in RANKED:
+        for season in CSV_URLS[family]:
+            get_leaderboard(family, season)
+            if family in HIGHLIGHTS:
+                get_highlights(family, season)
+    load_team_history()
+    get_player_index()
+    get_player_tables()
+    get_similarity()
+
+
+def prewarm():
+    start = time.perf_counter()
+    try:
+        for module in HEAVY_MODULES:
+            importlib.import_module(module)
+        _warm_caches()
+    except Exception:
+        # The pages load the same data on demand; a failed prewarm only costs latency.
+        logger.exception("Prewarm failed")
+        return
+    logger.info("Prewarm finished in %.1fs", time.perf_counter() - start)
+
+
+@st.cache_resource(show_spinner=False)
+def start_prewarm():
+    """Start the prewarm thread once per process; returns it (None when disabled).
+
+    Also starts the background refresher, which keeps the warmed stores fresh.
+    """
+    start_refresher()
+    if not ENABLED:
+        return None
+    thread = threading.Thread(target=prewarm, name="firstdown-prewarm", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,61 @@
+"""Background refresh of the live season, off the request path.
+
+``start_refresher()`` starts one daemon thread per server process that
+rebuilds every family's store each ``REFRESH_INTERVAL`` seconds: the live
+season is revalidated against its sheet, parsed, cleaned and stacked with
+the frozen seasons, then swapped into the store registry in one assignment
+(see ``utils.store.refresh_store``, which logs duration and row delta).
+
+The interval is kept below ``STORE_TTL``, so while the scheduler runs no
+request finds an expired store and none waits on a fetch.  It does nothing
+when data comes from an offline snapshot or from shared memory, which have
+their own publishers.
+
+Configuration:
+    FIRSTDOWN_REFRESH_INTERVAL  seconds between refreshes (default 300, capped at
+                                STORE_TTL / 2; 0 disables)
+"""
+
+import logging
+import os
+import threading
+
+import streamlit as st
+
+from utils import shared
+from utils.store import KEYS, OFFLINE, STORE_TTL, refresh_store
+
+logger = logging.getLogger(__name__)
+
+REFRESH_INTERVAL = min(float(os.environ.get("FIRSTDOWN_REFRESH_INTERVAL", 300)), STORE_TTL / 2)
+
+
+def refresh_all():
+    for family in KEYS:
+        try:
+            # max_age=0: always revalidate; an unchanged sheet costs one 304.
+            refresh_store(family, max_age=0)
+        except Exception:
+            # Keep serving the previous store; the next tick tries again.
+            logger.exception("Refresh of %s failed", family)
+
+
+def _run(stop):
+    while not stop.wait(REFRESH_INTERVAL):
+        refresh_all()
+
+
+def _stop(stop):
+    if stop is not None:
+        stop.set()
+
+
+# Clearing the resource cache stops the thread instead of orphaning it.
+@st.cache_resource(show_spinner=False, on_release=_stop)
+def start_refresher():
+    """Start the refresh thread once per process; returns its stop event (None when off)."""
+    if REFRESH_INTERVAL <= 0 or OFFLINE or shared.ENABLED:
+        return None
+    stop = threading.Event()
+    threading.Thread(target=_run, args=(stop,), name="firstdown-refresh", daemon=True).start()
+    return stop
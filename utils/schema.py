@@ -0,0 +1,83 @@
+"""Column schemas for each sheet family and the CSV parser that applies them.
+
+Each schema declares which columns are integers (nullable), floats and
+``"12.3%"`` percentages, so a sheet is parsed once straight into its final
+dtypes instead of being read as strings and coerced column by column.
+"""
+
+import csv
+import hashlib
+import io
+
+import pandas as pd
+
+# The multithreaded Arrow CSV reader; pyarrow is a hard dependency (the
+# disk cache, snapshots and shared stores all use Arrow files).
+ENGINE = 'pyarrow'
+
+SCHEMAS = {
+    'passing': {
+        'int': ['G', 'Age', 'Cmp', 'Att', 'Yds', 'TD', 'Int', '1D'],
+        'float': ['Yards per First Down', 'First Down Rate per Game', 'Rate', 'QBR'],
+        'percent': ['First Down Rate', 'Succ%'],
+    },
+    'rushing': {
+        'int': ['Att', 'Yds', 'TD', '1D'],
+        'float': ['Explosiveness'],
+        'percent': ['Rushing First Down Rate'],
+    },
+    'receiving': {
+        'int': ['Rec', 'Yds', 'TD', '1D'],
+        'float': [],
+        'percent': [],
+    },
+    'teams': {
+        'int': ['TOTAL', 'RUSH', 'PASS', 'PEN'],
+        'float': [],
+        'percent': [],
+    },
+}
+
+
+def schema_fingerprint(name):
+    """Short hash of a schema, used to invalidate frames parsed with an older one."""
+    return hashlib.sha1(repr(SCHEMAS[name]).encode()).hexdigest()[:12]
+
+
+def _header(body):
+    first_line = body.split(b'\n', 1)[0].decode('utf-8-sig')
+    return next(csv.reader([first_line]), [])
+
+
+def _dtypes(schema, raw_columns):
+    dtypes = {}
+    for raw in raw_columns:
+        name = raw.strip()
+        if name in schema['int']:
+            dtypes[raw] = 'Int64'
+        elif name in schema['float']:
+            dtypes[raw] = 'float64'
+        elif name in schema['percent']:
+            dtypes[raw] = 'string'
+    return dtypes
+
+
+def parse_csv(body, name):
+    """Parse raw CSV bytes for sheet family ``name`` into its declared dtypes."""
+    schema = SCHEMAS[name]
+    dtypes = _dtypes(schema, _header(body))
+    try:
+        df = pd.read_csv(io.BytesIO(body), engine=ENGINE, dtype=dtypes)
+    except (ValueError, TypeError):
+        # A stray non-numeric cell; read loosely and coerce it to NA instead.
+        loose = {col: 'string' for col in dtypes}
+        df = pd.read_csv(io.BytesIO(body), dtype=loose)
+        for col, dtype in dtypes.items():
+            if dtype != 'string':
+                df[col] = pd.to_numeric(df[col], errors='coerce').astype(dtype)
+
+    df.columns = df.columns.str.strip()
+    for col in schema['percent']:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col].str.rstrip('%'), errors='coerce').astype('float64')
+    return df
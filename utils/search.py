@@ -0,0 +1,134 @@
+"""Player-name search index across every season and position dataset.
+
+The index is built once per version of the passing, rushing and receiving
+stores.  Names are normalised (lowercase, accents and punctuation removed)
+and indexed two ways:
+
+* word-start prefixes in a sorted list, ranked first for one- and
+  two-letter queries, which then scan the names for other substrings;
+* trigram postings, for substring queries (candidates from intersecting
+  postings, then verified) and fuzzy matches (ranked by shared trigrams).
+
+Every hit carries the (position, season) rows the name appears in.
+"""
+
+import bisect
+import re
+import unicodedata
+
+import numpy as np
+
+from utils.memcache import cached, sizeof
+from utils.store import load_store
+
+POSITIONS = {'passing': 'QB / Passing', 'rushing': 'Rushing', 'receiving': 'Receiving'}
+FUZZY_MIN_SCORE = 0.35
+
+
+def normalize(name):
+    text = unicodedata.normalize('NFKD', str(name)).encode('ascii', 'ignore').decode()
+    return " ".join(re.sub(r"[^a-z0-9 ]+", " ", text.lower()).split())
+
+
+def _trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class PlayerIndex:
+    """Prefix, substring and fuzzy lookup of player names."""
+
+    def __init__(self, stores):
+        rows = {}
+        for family, store in stores.items():
+            for season, player in store.index.unique():
+                if isinstance(player, str) and player.strip():
+                    rows.setdefault(player, set()).add((family, int(season)))
+
+        self.names = sorted(rows)
+        self.rows = [sorted(rows[name], key=lambda r: (r[0], -r[1])) for name in self.names]
+        self.norm = [normalize(name) for name in self.names]
+
+        # Word-start prefixes: "patrick mahomes" is findable by "pa" and "ma".
+        starts = []
+        for i, text in enumerate(self.norm):
+            for m in re.finditer(r"\b\w", text):
+                starts.append((text[m.start():], i))
+        starts.sort()
+        self._starts = [s for s, _ in starts]
+        self._start_ids = [i for _, i in starts]
+
+        postings = {}
+        self._gram_counts = np.zeros(len(self.norm), dtype=np.int32)
+        for i, text in enumerate(self.norm):
+            grams = _trigrams(text)
+            self._gram_counts[i] = len(grams)
+            for gram in grams:
+                postings.setdefault(gram, []).append(i)
+        self._postings = {g: np.asarray(ids, dtype=np.int32) for g, ids in postings.items()}
+
+    def __sizeof__(self):
+        # Names, rows, prefix lists and postings arrays, for the memcache budget.
+        return object.__sizeof__(self) + sum(sizeof(value) for value in vars(self).values())
+
+    def _prefix_ids(self, query):
+        lo = bisect.bisect_left(self._starts, query)
+        hi = bisect.bisect_left(self._starts, query + "\uffff")
+        return list(dict.fromkeys(self._start_ids[lo:hi]))
+
+    def _short_ids(self, query):
+        # Too short for trigrams: word starts first, then a scan of the names.
+        ids = self._prefix_ids(query)
+        seen = set(ids)
+        return ids + [i for i, text in enumerate(self.norm) if query in text and i not in seen]
+
+    def _substring_ids(self, query, grams):
+        lists = sorted((self._postings.get(g, np.empty(0, np.int32)) for g in grams), key=len)
+        candidates = lists[0]
+        for ids in lists[1:]:
+            if not len(candidates):
+                break
+            candidates = np.intersect1d(candidates, ids, assume_unique=True)
+        return [int(i) for i in candidates if query in self.norm[i]]
+
+    def _fuzzy_scores(self, grams):
+        hits = [self._postings[g] for g in grams if g in self._postings]
+        if not hits:
+            return np.zeros(len(self.norm))
+        shared = np.bincount(np.concatenate(hits), minlength=len(self.norm))
+        return shared / np.maximum(self._gram_counts, len(grams))
+
+    def search(self, query, limit=20, fuzzy=True):
+        """Best matches first: ``[{'name', 'score', 'rows': [(family, season)]}]``."""
+        q = normalize(query)
+        if not q:
+            return []
+        grams = _trigrams(q)
+        ids = self._short_ids(q) if len(q) < 3 else self._substring_ids(q, grams)
+        scored = [(i, 1.0) for i in ids]
+
+        if fuzzy and grams and len(scored) < limit:
+            scores = self._fuzzy_scores(grams)
+            scores[ids] = 0
+            best = np.argsort(-scores, kind='stable')[:limit - len(scored)]
+            scored += [(int(i), float(scores[i])) for i in best if scores[i] >= FUZZY_MIN_SCORE]
+
+        return [
+            {'name': self.names[i], 'score': round(score, 2), 'rows': self.rows[i]}
+            for i, score in scored[:limit]
+        ]
+
+    def matching_names(self, query, fuzzy=False):
+        """Set of exact player names matching ``query``, for filtering a frame."""
+        return {hit['name'] for hit in self.search(query, limit=len(self.names), fuzzy=fuzzy)}
+
+
+@cached(name='player_index')
+def _build_index(_stores, versions):
+    return PlayerIndex(_stores)
+
+
+def get_player_index():
+    """Index over every season of every position; rebuilt when a store changes."""
+    stores = {family: load_store(family) for family in POSITIONS}
+    versions = tuple(store.attrs.get('version') for store in stores.values())
+    return _build_index(stores, versions)
@@ -0,0 +1,127 @@
+"""Consolidated stores published once per host and shared by every server.
+
+    python -m utils.shared --root /dev/shm/firstdown --every 600   # loader
+    FIRSTDOWN_SHARED_DIR=/dev/shm/firstdown streamlit run app.py     # workers
+
+The loader builds each family's store and writes it as an uncompressed
+Arrow IPC file into a new generation directory (on tmpfs, so it is RAM),
+then atomically replaces the root's ``CURRENT`` pointer.  Workers memory-map
+the current generation read-only: the Arrow buffers exist once per host
+however many processes attach, and a refresh becomes visible to all of them
+on the next pointer check.  Superseded generations are removed after
+``KEEP`` newer ones exist, so workers still holding an old map finish safely.
+"""
+
+import argparse
+import json
+import logging
+import os
+import shutil
+import time
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from utils.disk_cache import _write_atomic
+
+logger = logging.getLogger(__name__)
+
+SHARED_DIR = os.environ.get("FIRSTDOWN_SHARED_DIR")
+ENABLED = bool(SHARED_DIR)
+KEEP = 3
+
+
+def current_generation(root=SHARED_DIR):
+    """Name of the generation the root currently points at."""
+    return (Path(root) / "CURRENT").read_text().strip()
+
+
+def publish(stores, root=SHARED_DIR):
+    """Write ``{family: store}`` as a new generation and make it current."""
+    root = Path(root)
+    generation = f"{time.time_ns():x}"
+    directory = root / generation
+    directory.mkdir(parents=True)
+    for family, store in stores.items():
+        table = pa.Table.from_pandas(store.reset_index(), preserve_index=False)
+        table = table.replace_schema_metadata({
+            **(table.schema.metadata or {}),
+            b'firstdown': json.dumps({'index': list(store.index.names), 'attrs': store.attrs}).encode(),
+        })
+        feather.write_feather(table, directory / f"{family}.arrow", compression='uncompressed')
+    _write_atomic(root / "CURRENT", lambda p: p.write_text(generation))
+
+    for old in sorted(p for p in root.iterdir() if p.is_dir())[:-KEEP]:
+        shutil.rmtree(old, ignore_errors=True)
+    return generation
+
+
+def attach(family, generation, root=SHARED_DIR):
+    """Read-only view of one published store, memory-mapped from the generation.
+
+    Data columns stay Arrow-backed (``pd.ArrowDtype``) so their buffers are
+    the mapped pages themselves; converting them to NumPy, masked or
+    categorical dtypes would copy every nullable integer and dictionary
+    column into each worker.  Only the index levels are materialised.
+    Use ``to_native`` on the slices a page works with.
+    """
+    table = feather.read_table(Path(root) / generation / f"{family}.arrow", memory_map=True)
+    meta = json.loads(table.schema.metadata[b'firstdown'])
+    store = table.drop_columns(meta['index']).to_pandas(types_mapper=pd.ArrowDtype)
+    store.index = pd.MultiIndex.from_frame(table.select(meta['index']).to_pandas())
+    store.attrs.update(meta['attrs'])
+    return store
+
+
+# Arrow integers come back as the nullable dtypes build_store produces.
+_NULLABLE = {
+    pa.int8(): pd.Int8Dtype(),
+    pa.int16(): pd.Int16Dtype(),
+    pa.int32(): pd.Int32Dtype(),
+    pa.int64(): pd.Int64Dtype(),
+}
+
+
+def to_native(frame):
+    """``frame`` with Arrow-backed columns converted to the store's usual dtypes.
+
+    Dictionaries become categoricals, integers nullable ``Int*`` and floats
+    ``float64``.  Frames without Arrow columns are returned unchanged.
+    """
+    arrow = [col for col, dtype in frame.dtypes.items() if isinstance(dtype, pd.ArrowDtype)]
+    if not arrow:
+        return frame
+    frame = frame.copy(deep=False)
+    for col in arrow:
+        frame[col] = pa.array(frame[col].array).to_pandas(types_mapper=_NULLABLE.get).array
+    return frame
+
+
+def main(argv=None):
+    from utils.store import KEYS, fetch_store
+
+    parser = argparse.ArgumentParser(description="Publish every store into shared memory.")
+    parser.add_argument("--root", default=SHARED_DIR or "/dev/shm/firstdown", help="shared directory (tmpfs)")
+    parser.add_argument("--every", type=float, default=0, help="republish every N seconds (0: once)")
+    args = parser.parse_args(argv)
+
+    while True:
+        start = time.perf_counter()
+        try:
+            generation = publish({family: fetch_store(family) for family in KEYS}, args.root)
+        except Exception:
+            if not args.every:
+                raise
+            # Workers keep serving the current generation until a cycle succeeds.
+            logger.exception("Publishing failed; retrying in %.0fs", args.every)
+        else:
+            print(f"Published generation {generation} in {time.perf_counter() - start:.1f}s", flush=True)
+        if not args.every:
+            break
+        time.sleep(args.every)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""All-pairs similarity of team-seasons by first-down profile.
+
+Every (TEAM, Season) row of the teams store is a point in TOTAL / PASS /
+RUSH / PEN space, with each metric z-scored over all team-seasons so the
+small penalty counts weigh as much as the totals.  The full distance
+matrix is computed once per store version with NumPy broadcasting and the
+neighbours of every row are pre-sorted, so "most similar" is a row lookup
+and a slice.
+"""
+
+import numpy as np
+
+from utils.memcache import cached
+from utils.store import load_store
+
+PROFILE = ['TOTAL', 'PASS', 'RUSH', 'PEN']
+
+
+def build_similarity(store, metrics=PROFILE):
+    """``{'teams', 'seasons', 'position', 'distance', 'neighbours'}`` for ``store``."""
+    values = store[metrics].to_numpy(dtype='float64', na_value=np.nan)
+    mean, std = np.nanmean(values, axis=0), np.nanstd(values, axis=0)
+    z = np.nan_to_num((values - mean) / np.where(std > 0, std, 1.0))
+
+    # (n, 1, m) - (1, n, m) -> (n, n, m); 160 team-seasons is a 100 KB matrix.
+    distance = np.sqrt(((z[:, None, :] - z[None, :, :]) ** 2).sum(axis=-1))
+    neighbours = np.argsort(distance, axis=1, kind='stable')
+
+    teams = store.index.get_level_values('TEAM').astype(str).to_numpy()
+    seasons = store.index.get_level_values('Season').to_numpy().astype(int)
+    position = {(team, season): i for i, (team, season) in enumerate(zip(teams, seasons))}
+    return {
+        'teams': teams,
+        'seasons': seasons,
+        'position': position,
+        'distance': distance,
+        'neighbours': neighbours,
+    }
+
+
+@cached(name='team_similarity')
+def _cached_similarity(_store, version):
+    return build_similarity(_store)
+
+
+def get_similarity():
+    """Similarity tables for the current teams store."""
+    store = load_store('teams')
+    return _cached_similarity(store, store.attrs.get('version'))
+
+
+def most_similar(sim, team, season, k=5):
+    """The ``k`` closest other team-seasons: ``[(team, season, distance)]``."""
+    i = sim['position'][(team, int(season))]
+    closest = sim['neighbours'][i]
+    closest = closest[closest != i][:k]
+    return [(sim['teams'][j], int(sim['seasons'][j]), float(sim['distance'][i, j])) for j in closest]
+
+
+def distance_matrix(sim, teams, season):
+    """Pairwise distances between ``teams`` within one season, in that order."""
+    rows = [sim['position'][(team, int(season))] for team in teams]
+    return sim['distance'][np.ix_(rows, rows)]
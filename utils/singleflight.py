@@ -0,0 +1,52 @@
+"""Coalesce concurrent calls for the same key into one execution.
+
+    flights = SingleFlight()
+    df = flights.do(url, fetch, url)
+
+The first caller for a key runs the function; callers arriving while it is
+in flight wait and receive the same result (or exception).  Once it
+finishes the key is free again, so later calls run afresh; this is
+request coalescing, not a cache.  Waiters share the returned object, so it
+must be treated as read-only.
+"""
+
+import threading
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """At most one in-flight call per key."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn, *args, **kwargs):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
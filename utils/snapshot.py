@@ -0,0 +1,145 @@
+"""Offline snapshot bundles of every sheet.
+
+    python -m utils.snapshot                 # writes .snapshots/<version>/
+    FIRSTDOWN_SNAPSHOT=.snapshots streamlit run app.py
+
+A snapshot is a directory of uncompressed Arrow IPC (Feather v2) files,
+one per sheet, parsed with the sheet's schema, plus a ``manifest.json``
+mapping each source URL to its file, row count and SHA-256 of the CSV.
+Snapshots are written to a fresh version directory and published by
+atomically replacing the root's ``CURRENT`` pointer.
+
+With ``FIRSTDOWN_SNAPSHOT`` set (to the root or to one version directory)
+the store reads every season from the snapshot instead of the network.
+Files are memory-mapped, so reading a sheet is a page-cache hit with no
+decoding, but each sheet is then converted to pandas and every server
+process builds its own store from it; for one copy of the stores per host
+see ``utils.shared``.
+
+``CURRENT`` is re-read on every sheet read, i.e. whenever a store is
+rebuilt (every ``STORE_TTL``), so running servers move to a newly
+published snapshot without a restart.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from utils import disk_cache
+from utils.schema import parse_csv, schema_fingerprint
+from utils.sources import CSV_URLS
+
+DEFAULT_ROOT = Path(__file__).resolve().parent.parent / ".snapshots"
+SNAPSHOT = os.environ.get("FIRSTDOWN_SNAPSHOT")
+ENABLED = bool(SNAPSHOT)
+
+
+# --------------------------
+# Reading
+# --------------------------
+def resolve(path):
+    """Version directory for ``path``: itself if it has a manifest, else root/CURRENT."""
+    path = Path(path)
+    if (path / "manifest.json").exists():
+        return path
+    return path / (path / "CURRENT").read_text().strip()
+
+
+def current():
+    """Version directory ``FIRSTDOWN_SNAPSHOT`` currently points at."""
+    return resolve(SNAPSHOT)
+
+
+# {version directory: {url: manifest entry}}; versions are never rewritten.
+_manifests = {}
+
+
+def _load_manifest():
+    directory = current()
+    files = _manifests.get(directory)
+    if files is None:
+        manifest = json.loads((directory / "manifest.json").read_text())
+        files = _manifests[directory] = {entry['url']: entry for entry in manifest['files']}
+    return directory, files
+
+
+def read_table(path):
+    """Memory-map one snapshot file as an Arrow table."""
+    return feather.read_table(path, memory_map=True)
+
+
+def read_snapshot(url, schema=None, max_age=None):
+    """Drop-in for ``read_csv_cached`` that serves ``url`` from the snapshot."""
+    directory, files = _load_manifest()
+    try:
+        entry = files[url]
+    except KeyError:
+        raise KeyError(f"{url} is not in snapshot {directory}") from None
+    if schema and entry['schema'] != schema_fingerprint(schema):
+        raise ValueError(f"Snapshot {directory} was built with an older {schema} schema; rebuild it")
+    return read_table(directory / entry['file']).to_pandas()
+
+
+# --------------------------
+# Writing
+# --------------------------
+def _fetch(family, season, url):
+    _, _, body = disk_cache._download(url, {})
+    df = parse_csv(body, family)
+    return {
+        'family': family,
+        'season': season,
+        'url': url,
+        'file': f"{family}_{season}.arrow",
+        'rows': len(df),
+        'sha256': hashlib.sha256(body).hexdigest(),
+        'schema': schema_fingerprint(family),
+    }, df
+
+
+def create_snapshot(root=DEFAULT_ROOT, urls=CSV_URLS, max_workers=8):
+    """Download every sheet into a new version directory under ``root``."""
+    root = Path(root)
+    jobs = [(family, season, url) for family, seasons in urls.items() for season, url in seasons.items()]
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        results = list(pool.map(lambda job: _fetch(*job), jobs))
+
+    content = hashlib.sha256("".join(entry['sha256'] for entry, _ in results).encode()).hexdigest()
+    version = f"{time.strftime('%Y%m%dT%H%M%S')}-{content[:8]}"
+    directory = root / version
+    directory.mkdir(parents=True)
+
+    for entry, df in results:
+        # Uncompressed so the file can be memory-mapped without decoding.
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        feather.write_feather(table, directory / entry['file'], compression='uncompressed')
+
+    manifest = {'version': version, 'created_at': time.time(), 'files': [entry for entry, _ in results]}
+    (directory / "manifest.json").write_text(json.dumps(manifest, indent=2))
+    disk_cache._write_atomic(root / "CURRENT", lambda p: p.write_text(version))
+    return directory
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Download every sheet into an offline snapshot.")
+    parser.add_argument("--root", default=str(DEFAULT_ROOT), help="snapshot root directory")
+    parser.add_argument("--workers", type=int, default=8, help="concurrent downloads")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    directory = create_snapshot(args.root, max_workers=args.workers)
+    manifest = json.loads((directory / "manifest.json").read_text())
+    rows = sum(entry['rows'] for entry in manifest['files'])
+    print(f"Wrote {len(manifest['files'])} sheets ({rows:,} rows) to {directory} "
+          f"in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
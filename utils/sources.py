@@ -0,0 +1,56 @@
+"""Published Google Sheets CSV sources, keyed by dataset and season, plus team reference data."""
+
+CSV_URLS = {
+    'passing': {
+        '2024': "https://docs.google.com/spreadsheets/d/e/2PACX-1vS_MsjqbDCt5ffmLWWZ0c-pPjkFwoUT6TmQdSo1m4peXEO42c9wTs3V4C5lw9VyRXaeexUB7nFJCZLe/pub?gid=1348857990&single=true&output=csv",
+        '2023': "https://docs.google.com/spreadsheets/d/e/2PACX-1vS_MsjqbDCt5ffmLWWZ0c-pPjkFwoUT6TmQdSo1m4peXEO42c9wTs3V4C5lw9VyRXaeexUB7nFJCZLe/pub?gid=1490524640&single=true&output=csv",
+        '2022': "https://docs.google.com/spreadsheets/d/e/2PACX-1vS_MsjqbDCt5ffmLWWZ0c-pPjkFwoUT6TmQdSo1m4peXEO42c9wTs3V4C5lw9VyRXaeexUB7nFJCZLe/pub?gid=1282758623&single=true&output=csv",
+        '2021': "https://docs.google.com/spreadsheets/d/e/2PACX-1vS_MsjqbDCt5ffmLWWZ0c-pPjkFwoUT6TmQdSo1m4peXEO42c9wTs3V4C5lw9VyRXaeexUB7nFJCZLe/pub?gid=498746140&single=true&output=csv",
+        '2020': "https://docs.google.com/spreadsheets/d/e/2PACX-1vS_MsjqbDCt5ffmLWWZ0c-pPjkFwoUT6TmQdSo1m4peXEO42c9wTs3V4C5lw9VyRXaeexUB7nFJCZLe/pub?gid=2108600758&single=true&output=csv",
+    },
+    'rushing': {
+        '2024': "https://docs.google.com/spreadsheets/d/e/2PACX-1vRf8IihZAe5eWGCyglTOuc0TNpYi8M5OY9LmHI90BlGvUTbh4zHQqxZnm_oeioI3SdJnzwLWoYN1qPC/pub?gid=574291986&single=true&output=csv",
+        '2023': "https://docs.google.com/spreadsheets/d/e/2PACX-1vRf8IihZAe5eWGCyglTOuc0TNpYi8M5OY9LmHI90BlGvUTbh4zHQqxZnm_oeioI3SdJnzwLWoYN1qPC/pub?gid=1218519657&single=true&output=csv",
+        '2022': "https://docs.google.com/spreadsheets/d/e/2PACX-1vRf8IihZAe5eWGCyglTOuc0TNpYi8M5OY9LmHI90BlGvUTbh4zHQqxZnm_oeioI3SdJnzwLWoYN1qPC/pub?gid=107479071&single=true&output=csv",
+        '2021': "https://docs.google.com/spreadsheets/d/e/2PACX-1vRf8IihZAe5eWGCyglTOuc0TNpYi8M5OY9LmHI90BlGvUTbh4zHQqxZnm_oeioI3SdJnzwLWoYN1qPC/pub?gid=1376297477&single=true&output=csv",
+        '2020': "https://docs.google.com/spreadsheets/d/e/2PACX-1vRf8IihZAe5eWGCyglTOuc0TNpYi8M5OY9LmHI90BlGvUTbh4zHQqxZnm_oeioI3SdJnzwLWoYN1qPC/pub?gid=1118278232&single=true&output=csv",
+    },
+    'receiving': {
+        '2024': "https://docs.google.com/spreadsheets/d/e/2PACX-1vSB3lqA0ukLtNUK9E_FwHfqs7z1hMFsqg-7Uz_qfD3RXr3h5m4lxw_i7HT8iNq2oLCBNp6D64BMsNcQ/pub?gid=972788191&single=true&output=csv",
+        '2023': "https://docs.google.com/spreadsheets/d/e/2PACX-1vSB3lqA0ukLtNUK9E_FwHfqs7z1hMFsqg-7Uz_qfD3RXr3h5m4lxw_i7HT8iNq2oLCBNp6D64BMsNcQ/pub?gid=110992447&single=true&output=csv",
+        '2022': "https://docs.google.com/spreadsheets/d/e/2PACX-1vSB3lqA0ukLtNUK9E_FwHfqs7z1hMFsqg-7Uz_qfD3RXr3h5m4lxw_i7HT8iNq2oLCBNp6D64BMsNcQ/pub?gid=174961977&single=true&output=csv",
+        '2021': "https://docs.google.com/spreadsheets/d/e/2PACX-1vSB3lqA0ukLtNUK9E_FwHfqs7z1hMFsqg-7Uz_qfD3RXr3h5m4lxw_i7HT8iNq2oLCBNp6D64BMsNcQ/pub?gid=1512587819&single=true&output=csv",
+        '2020': "https://docs.google.com/spreadsheets/d/e/2PACX-1vSB3lqA0ukLtNUK9E_FwHfqs7z1hMFsqg-7Uz_qfD3RXr3h5m4lxw_i7HT8iNq2oLCBNp6D64BMsNcQ/pub?gid=542561212&single=true&output=csv",
+    },
+    'teams': {
+        '2024': "https://docs.google.com/spreadsheets/d/e/2PACX-1vQ8nXQrw7rxiNxNFCHAcmPcZsKzH3f_CnYX7ZIijsduJ-suI4lPUyxbAL0HFH14E7xMv5IW-Ov8t6cM/pub?gid=0&single=true&output=csv",
+        '2023': "https://docs.google.com/spreadsheets/d/e/2PACX-1vQ8nXQrw7rxiNxNFCHAcmPcZsKzH3f_CnYX7ZIijsduJ-suI4lPUyxbAL0HFH14E7xMv5IW-Ov8t6cM/pub?gid=891552912&single=true&output=csv",
+        '2022': "https://docs.google.com/spreadsheets/d/e/2PACX-1vQ8nXQrw7rxiNxNFCHAcmPcZsKzH3f_CnYX7ZIijsduJ-suI4lPUyxbAL0HFH14E7xMv5IW-Ov8t6cM/pub?gid=1500595878&single=true&output=csv",
+        '2021': "https://docs.google.com/spreadsheets/d/e/2PACX-1vQ8nXQrw7rxiNxNFCHAcmPcZsKzH3f_CnYX7ZIijsduJ-suI4lPUyxbAL0HFH14E7xMv5IW-Ov8t6cM/pub?gid=1119294445&single=true&output=csv",
+        '2020': "https://docs.google.com/spreadsheets/d/e/2PACX-1vQ8nXQrw7rxiNxNFCHAcmPcZsKzH3f_CnYX7ZIijsduJ-suI4lPUyxbAL0HFH14E7xMv5IW-Ov8t6cM/pub?gid=1068926879&single=true&output=csv",
+    },
+}
+
+# The only season still being played; every other season in CSV_URLS is
+# complete and treated as immutable by the ingest layer.
+LIVE_SEASON = '2024'
+
+
+def completed_seasons(family):
+    return [season for season in CSV_URLS[family] if season != LIVE_SEASON]
+
+
+# Conference for each team name used in the 'teams' sheets
+team_conference = {
+    'Detroit Lions': 'NFC', 'Tampa Bay Buccaneers': 'NFC', 'Baltimore Ravens': 'AFC',
+    'Washington Commanders': 'NFC', 'Cincinnati Bengals': 'AFC', 'Buffalo Bills': 'AFC',
+    'Philadelphia Eagles': 'NFC', 'Atlanta Falcons': 'NFC', 'Arizona Cardinals': 'NFC',
+    'Minnesota Vikings': 'NFC', 'San Francisco 49ers': 'NFC', 'Kansas City Chiefs': 'AFC',
+    'Miami Dolphins': 'AFC', 'Green Bay Packers': 'NFC', 'Los Angeles Rams': 'NFC',
+    'Seattle Seahawks': 'NFC', 'Dallas Cowboys': 'NFC', 'Pittsburgh Steelers': 'AFC',
+    'Los Angeles Chargers': 'AFC', 'Denver Broncos': 'AFC', 'Indianapolis Colts': 'AFC',
+    'New York Jets': 'AFC', 'Las Vegas Raiders': 'AFC', 'Tennessee Titans': 'AFC',
+    'Houston Texans': 'AFC', 'New Orleans Saints': 'NFC', 'Cleveland Browns': 'AFC',
+    'New England Patriots': 'AFC', 'New York Giants': 'NFC', 'Jacksonville Jaguars': 'AFC',
+    'Chicago Bears': 'NFC', 'Carolina Panthers': 'NFC',
+}
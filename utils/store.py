@@ -0,0 +1,246 @@
+"""Consolidated multi-season store for each dataset family.
+
+``load_store(family)`` fetches every season of a family once, cleans it,
+and stacks the seasons into a single frame indexed by ``(Season, Player)``
+(``(Season, TEAM)`` for the team sheets) with compact dtypes.  Pages slice
+one or many seasons out of it instead of keeping a frame per year.
+
+Completed seasons are frozen: they are read once (from disk when present,
+never revalidated) and cached without expiry.  Only ``LIVE_SEASON`` is
+re-checked.  Built stores sit in a per-process registry and are replaced
+whole by ``refresh_store``, normally from the background scheduler in
+``utils.refresh``; a request only rebuilds a store itself when none exists
+yet or the current one is older than ``STORE_TTL`` (no scheduler running).
+
+With ``FIRSTDOWN_SNAPSHOT`` set, every season is read from the offline
+snapshot bundle (see ``utils.snapshot``) and the network is never used.
+
+With ``FIRSTDOWN_SHARED_DIR`` set, stores are not built here at all: they
+are attached read-only from the generation a loader process published into
+shared memory (see ``utils.shared``).
+"""
+
+import hashlib
+import logging
+import time
+from functools import partial
+
+import pandas as pd
+import streamlit as st
+
+from utils.disk_cache import MAX_AGE, read_csv_cached
+from utils import shared, snapshot
+from utils.loaders import load_seasons
+from utils.memcache import cached, sizeof
+from utils.singleflight import SingleFlight
+from utils.snapshot import ENABLED as OFFLINE, read_snapshot
+from utils.sources import CSV_URLS, LIVE_SEASON, completed_seasons, team_conference
+
+logger = logging.getLogger(__name__)
+
+STORE_TTL = 600
+
+# Sheet reader: the offline snapshot when one is configured, else the disk-cached fetch.
+read_sheet = read_snapshot if OFFLINE else read_csv_cached
+
+# Row key for each family; together with Season it forms the store index.
+KEYS = {
+    'passing': 'Player',
+    'rushing': 'Player',
+    'receiving': 'Player',
+    'teams': 'TEAM',
+}
+
+
+# --------------------------
+# Per-family cleaning
+# --------------------------
+def _clean_rushing(df):
+    df['Rushing First Down Rate'] = df['Rushing First Down Rate'].fillna(0)
+    df['YPC'] = (df['Yds'] / df['Att']).astype('float64').round(2)
+    return df
+
+
+def _clean_teams(df):
+    df['Conference'] = df['TEAM'].map(team_conference)
+    return df
+
+
+# Parsing, dtypes and percentage stripping come from utils.schema; these only
+# add the derived columns each family needs.
+CLEANERS = {
+    'rushing': _clean_rushing,
+    'teams': _clean_teams,
+}
+
+
+# Name columns stored as categoricals.  Categories are taken from every
+# season at once, so codes mean the same team/player in every season and
+# filters, ``isin`` and groupbys compare integer codes.
+CATEGORICAL = ['Player', 'Team', 'TEAM']
+CONFERENCE_DTYPE = pd.CategoricalDtype(sorted(set(team_conference.values())))
+
+
+def _categorize(df):
+    for col in CATEGORICAL:
+        if col in df.columns:
+            values = df[col].str.strip()
+            df[col] = values.astype(pd.CategoricalDtype(sorted(values.dropna().unique())))
+    if 'Conference' in df.columns:
+        df['Conference'] = df['Conference'].astype(CONFERENCE_DTYPE)
+    return df
+
+
+def _compact(df):
+    """Downcast integer columns to the smallest integer dtype that fits."""
+    for col in df.select_dtypes('integer').columns:
+        df[col] = pd.to_numeric(df[col], downcast='integer')
+    return df
+
+
+# --------------------------
+# Store
+# --------------------------
+def build_store(family, frames):
+    """Stack ``{season: raw_df}`` into one cleaned, season-indexed frame."""
+    clean = CLEANERS.get(family, lambda df: df)
+    seasons = sorted(frames, key=int)
+    store = pd.concat(
+        [clean(frames[season].copy()) for season in seasons],
+        keys=pd.Index([int(s) for s in seasons], dtype='int16', name='Season'),
+    )
+    store = _categorize(_compact(store.droplevel(1)))
+    store = store.set_index(KEYS[family], append=True)
+    # Content token so derived caches (leaderboards etc.) rebuild with the store.
+    # Hashed over the row hashes in order: leaderboards hold row positions, so
+    # a re-sorted sheet with the same rows must get a new version.
+    row_hashes = pd.util.hash_pandas_object(store).to_numpy()
+    store.attrs['version'] = f"{family}:{hashlib.sha1(row_hashes.tobytes()).hexdigest()[:16]}"
+    return store
+
+
+@cached(name='completed_seasons')
+def load_completed_seasons(family, source=None):
+    """Raw frames for the finished seasons.
+
+    Held in the byte-bounded memcache; if evicted they are re-read from the
+    disk cache (never from the network) on the next rebuild.  ``source``
+    only keys the cache: the snapshot version in offline mode, so a newly
+    published snapshot is read in.
+    """
+    urls = {season: CSV_URLS[family][season] for season in completed_seasons(family)}
+    loader = partial(read_sheet, schema=family, max_age=float('inf'))
+    return load_seasons(urls, loader=loader)
+
+
+@st.cache_resource(show_spinner=False)
+def _registry():
+    """``{family: (store, built_at)}`` shared by every session of the process."""
+    return {}
+
+
+_rebuilds = SingleFlight()
+
+
+def refresh_store(family, max_age=MAX_AGE):
+    """Rebuild ``family``'s store and swap it into the registry; returns it.
+
+    Readers keep whichever store they already hold; the registry entry is
+    replaced in one assignment, so nobody sees a half-built store.  Callers
+    arriving during a rebuild of the same family (a burst of sessions after
+    a restart, or a request racing the scheduler) wait for it and share it.
+    """
+    return _rebuilds.do(family, _rebuild_store, family, max_age)
+
+
+def _season_frames(family, max_age):
+    """Frozen completed seasons plus the live one, revalidated after ``max_age``."""
+    frames = dict(load_completed_seasons(family, snapshot.current() if OFFLINE else None))
+    if LIVE_SEASON in CSV_URLS[family]:
+        frames[LIVE_SEASON] = read_sheet(CSV_URLS[family][LIVE_SEASON], schema=family, max_age=max_age)
+    return frames
+
+
+def _rebuild_store(family, max_age):
+    start = time.perf_counter()
+    store = build_store(family, _season_frames(family, max_age))
+
+    registry = _registry()
+    old = registry.get(family, (None, 0))[0]
+    registry[family] = (store, time.time())
+
+    old_rows = len(old) if old is not None else 0
+    logger.info(
+        "Refreshed %s in %.0fms: %d rows (%+d)%s", family, (time.perf_counter() - start) * 1000,
+        len(store), len(store) - old_rows,
+        "" if old is None or old.attrs.get('version') != store.attrs['version'] else ", unchanged",
+    )
+    return store
+
+
+# cache_resource hands out the attached frame itself (cache_data would copy it
+# per call); one entry per family for the current and the previous generation.
+@st.cache_resource(max_entries=2 * len(KEYS), show_spinner=False)
+def _attach_shared_store(family, generation):
+    return shared.attach(family, generation)
+
+
+def load_store(family):
+    """Every season of ``family`` in one frame indexed by ``(Season, key)``.
+
+    Treat the result as read-only.  In shared mode its data columns are
+    Arrow-backed views of the published generation; ``season_frame`` and
+    ``stacked_frame`` return slices in the usual dtypes.
+    """
+    if shared.ENABLED:
+        return _attach_shared_store(family, shared.current_generation())
+    store, built_at = _registry().get(family, (None, 0))
+    if store is None or time.time() - built_at > STORE_TTL:
+        store = refresh_store(family)
+    return store
+
+
+def store_report():
+    """One row per store in the registry: rows, deep bytes, age and version."""
+    now = time.time()
+    return [
+        {
+            'family': family,
+            'rows': len(store),
+            'bytes': sizeof(store),
+            'age_s': round(now - built_at, 1),
+            'version': store.attrs.get('version'),
+        }
+        for family, (store, built_at) in _registry().items()
+    ]
+
+
+def fetch_store(family, max_age=MAX_AGE):
+    """Build ``family``'s store outside the registry (for loader processes).
+
+    Reads the same way as ``refresh_store``: completed seasons stay frozen
+    and only the live season is revalidated.
+    """
+    return build_store(family, _season_frames(family, max_age))
+
+
+def select_seasons(store, seasons):
+    """Rows for several seasons, keeping the ``(Season, key)`` index."""
+    return store.loc[[int(s) for s in seasons]]
+
+
+def stacked_frame(store, seasons):
+    """Several seasons as one flat frame with an ordered categorical ``Season``."""
+    frame = shared.to_native(select_seasons(store, seasons).reset_index())
+    frame['Season'] = pd.Categorical(frame['Season'], categories=sorted(int(s) for s in seasons), ordered=True)
+    return frame
+
+
+def season_frame(store, season):
+    """One season as a flat frame, row key back as a column, rows in sheet order."""
+    return shared.to_native(store.xs(int(season), level='Season').reset_index())
+
+
+def get_season(family, season):
+    """Shortcut for ``season_frame(load_store(family), season)``."""
+    return season_frame(load_store(family), season)
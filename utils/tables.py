@@ -0,0 +1,73 @@
+"""Server-side paged tables.
+
+``paged_table`` searches, sorts and pages a frame on the server and sends
+only the visible page to ``st.dataframe``, so the payload stays the same
+size however many rows (or seasons) the frame holds.  Display formatting
+is declared once per dataset as a ``column_config`` and applied by the
+browser, replacing the per-rerun pandas ``Styler`` pass.
+
+It runs as a fragment: paging, sorting or searching reruns only the table.
+"""
+
+import math
+
+import streamlit as st
+
+PAGE_SIZE = 25
+
+# Display formats per dataset, built once at import.
+COLUMN_CONFIG = {
+    'passing': {
+        'First Down Rate': st.column_config.NumberColumn(format="%.1f%%"),
+        'Succ%': st.column_config.NumberColumn(format="%.1f%%"),
+    },
+    'rushing': {
+        'Rushing First Down Rate': st.column_config.NumberColumn(format="%.2f%%"),
+        'YPC': st.column_config.NumberColumn(format="%.2f"),
+    },
+    'receiving': {},
+    'teams': {},
+}
+
+CURRENT_ORDER = "Rank"
+
+
+@st.fragment
+def paged_table(df, key, column_config=None, page_size=PAGE_SIZE, search_column=None,
+                search_label="Search:", matcher=None, height="auto"):
+    """Render ``df`` one page at a time with optional search and sort controls.
+
+    Rows keep ``df``'s order (and index) until another sort column is picked.
+    ``matcher(term)`` may return the set of ``search_column`` values to keep
+    (e.g. ``PlayerIndex.matching_names``); otherwise a substring scan is used.
+    """
+    controls = st.columns([3, 2, 1, 1] if search_column else [2, 1, 1])
+    if search_column:
+        with controls[0]:
+            search_term = st.text_input(search_label, key=f"{key}_search")
+        controls = controls[1:]
+        if search_term and matcher is not None:
+            df = df[df[search_column].isin(matcher(search_term))]
+        elif search_term:
+            df = df[df[search_column].str.contains(search_term, case=False, regex=False, na=False)]
+
+    numeric_columns = df.select_dtypes('number').columns.tolist()
+    with controls[0]:
+        sort_by = st.selectbox("Sort by", [CURRENT_ORDER] + numeric_columns, key=f"{key}_sort")
+    with controls[1]:
+        descending = st.toggle("Descending", value=True, key=f"{key}_desc")
+    if sort_by != CURRENT_ORDER:
+        df = df.sort_values(sort_by, ascending=not descending, kind='stable', na_position='last')
+
+    pages = max(1, math.ceil(len(df) / page_size))
+    page_key = f"{key}_page"
+    # Clamp before the widget is created when a search or filter shrank the table.
+    if st.session_state.get(page_key, 1) > pages:
+        st.session_state[page_key] = pages
+    with controls[2]:
+        page = st.number_input("Page", min_value=1, max_value=pages, step=1, key=page_key)
+
+    start = (page - 1) * page_size
+    page_df = df.iloc[start:start + page_size]
+    st.dataframe(page_df, column_config=column_config, width='stretch', height=height)
+    st.caption(f"Rows {min(start + 1, len(df))}–{start + len(page_df)} of {len(df)}")
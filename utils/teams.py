@@ -0,0 +1,30 @@
+"""Shared team first-down data for the team pages.
+
+``team_dashboard.py`` and ``compare_teams.py`` both read from the cached
+``teams`` store, so a season loaded on one page is already in memory when
+the other page asks for it.  Derived frames are cached per store version,
+so a refreshed store replaces them.
+"""
+
+from utils.memcache import cached
+from utils.shared import to_native
+from utils.store import get_season, load_store
+
+
+def load_team_season(year):
+    """Team first downs for one season, with the ``Conference`` column added."""
+    return get_season('teams', year)
+
+
+@cached(name='team_history')
+def _team_history(_store, version):
+    history = to_native(_store.reset_index())
+    history = history[['TEAM', 'TOTAL', 'RUSH', 'PASS', 'PEN', 'Season']].rename(columns={'Season': 'YEAR'})
+    history['YEAR'] = history['YEAR'].astype(int)
+    return history.sort_values(by=['TEAM', 'YEAR']).reset_index(drop=True)
+
+
+def load_team_history():
+    """All seasons stacked into one frame with an integer ``YEAR`` column."""
+    store = load_store('teams')
+    return _team_history(store, store.attrs.get('version'))
@@ -0,0 +1,97 @@
+"""Per-section timing for page reruns.
+
+    timer = PageTimer("passing")
+    df = get_season('passing', year)
+    timer.lap("load")
+    ...
+    with timer.section("top-10 chart"):
+        st.plotly_chart(fig)
+    timer.finish()
+
+``lap(name)`` charges the time since the previous lap (or since the timer
+was created) to ``name``; ``section(name)`` times a block explicitly.  Time
+spent inside ``st.*`` calls includes serialising the element for the
+browser, so a section that builds and sends a chart covers both.
+
+``finish()`` writes one JSON line per rerun to the ``firstdown.timing``
+logger and, when enabled, shows the numbers in a sidebar panel.  Only
+``time.perf_counter`` runs per section, so it is safe to leave on.
+
+Configuration:
+    FIRSTDOWN_TIMING_LOG   unset: log to stderr; "off": no log; else: file path
+    FIRSTDOWN_TIMING_PANEL "1" shows the sidebar panel on every page; it can
+                           also be opened per session with ``?debug=timing``
+"""
+
+import json
+import logging
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+import streamlit as st
+
+logger = logging.getLogger("firstdown.timing")
+logger.propagate = False
+
+_log_target = os.environ.get("FIRSTDOWN_TIMING_LOG", "")
+if _log_target.lower() in ("off", "0", "false"):
+    logger.disabled = True
+elif not logger.handlers:
+    handler = logging.FileHandler(_log_target) if _log_target else logging.StreamHandler(sys.stderr)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+
+PANEL_ENABLED = os.environ.get("FIRSTDOWN_TIMING_PANEL") == "1"
+
+
+def _panel_requested():
+    try:
+        return PANEL_ENABLED or st.query_params.get("debug") == "timing"
+    except Exception:
+        return PANEL_ENABLED
+
+
+class PageTimer:
+    """Collects named section timings for one rerun of one page."""
+
+    def __init__(self, page):
+        self.page = page
+        self.sections = {}
+        self._start = self._last = time.perf_counter()
+
+    def _add(self, name, seconds):
+        self.sections[name] = self.sections.get(name, 0.0) + seconds * 1000
+
+    def lap(self, name):
+        now = time.perf_counter()
+        self._add(name, now - self._last)
+        self._last = now
+
+    @contextmanager
+    def section(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            now = time.perf_counter()
+            self._add(name, now - start)
+            self._last = now
+
+    def finish(self):
+        total_ms = (time.perf_counter() - self._start) * 1000
+        if not logger.disabled:
+            logger.info(json.dumps({
+                "ts": round(time.time(), 3),
+                "page": self.page,
+                "total_ms": round(total_ms, 2),
+                "sections": {name: round(ms, 2) for name, ms in self.sections.items()},
+            }))
+        if _panel_requested():
+            with st.sidebar.expander("⏱️ Rerun timings", expanded=True):
+                rows = [{"section": name, "ms": round(ms, 1)} for name, ms in self.sections.items()]
+                rows.append({"section": "total", "ms": round(total_ms, 1)})
+                st.dataframe(rows, hide_index=True, width='stretch')
+        return total_ms